@@ -0,0 +1,294 @@
+"""The Streamlit app for the PyProBE dashboard.
+
+This script is run by :func:`pyprobe.dashboard.launch_dashboard` with ``streamlit run``.
+It is kept separate from :mod:`pyprobe.dashboard`, so that the Streamlit caches and
+fragments are only created inside a Streamlit runtime, rather than whenever PyProBE
+is imported.
+"""
+import os
+import pickle
+from typing import List, Optional, Tuple
+
+import plotly
+import polars as pl
+import streamlit as st
+from ordered_set import OrderedSet
+
+from pyprobe.cell import Cell
+from pyprobe.dashboard import _parse_filter, downsample
+from pyprobe.plot import Plot
+from pyprobe.result import Result
+from pyprobe.typing import FilterToExperimentType
+
+
+@st.cache_resource(show_spinner=False)
+def load_cell_list(path: str, modified_time: float) -> List[Cell]:
+    """Load the list of cells saved for the dashboard.
+
+    The cell list is cached across reruns and sessions of the dashboard, and is only
+    loaded again if the file has been modified.
+
+    Args:
+        path (str): The path to the pickled cell list.
+        modified_time (float): The modification time of the file.
+
+    Returns:
+        List[Cell]: The list of cells.
+    """
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+@st.cache_data(show_spinner=False)
+def filter_data(
+    _cell_list: List[Cell],
+    path: str,
+    modified_time: float,
+    cell_index: int,
+    procedure_name: str,
+    experiment_names: Tuple[str, ...],
+    filters: Tuple[Tuple[str, Tuple[int | range, ...]], ...],
+    columns: Tuple[str, ...],
+) -> Result:
+    """Filter the data of a selected cell and collect the requested columns.
+
+    Only the columns used by the dashboard are collected into memory. The result is
+    cached, so re-running the dashboard with the same selection does not repeat the
+    filtering. The cell list itself is not hashed, so the path and modification time
+    of the file it was loaded from are part of the cache key instead, so that results
+    are recalculated when the cell list is reloaded.
+
+    Args:
+        _cell_list (List[Cell]):
+            The list of cells in the dashboard. This argument is not hashed.
+        path (str): The path to the pickled cell list.
+        modified_time (float): The modification time of the pickled cell list.
+        cell_index (int): The index of the selected cell in the cell list.
+        procedure_name (str): The name of the selected procedure.
+        experiment_names (Tuple[str, ...]): The names of the selected experiments.
+        filters (Tuple[Tuple[str, Tuple[int | range, ...]], ...]):
+            The filter methods and arguments parsed from the user input.
+        columns (Tuple[str, ...]): The columns to collect.
+
+    Returns:
+        Result: The filtered data, containing only the requested columns.
+    """
+    procedure = _cell_list[cell_index].procedure[procedure_name]
+    experiment_data: FilterToExperimentType
+    if len(experiment_names) == 0:
+        experiment_data = procedure
+    else:
+        experiment_data = procedure.experiment(*experiment_names)
+    filtered_data = experiment_data
+    for method, arguments in filters:
+        filtered_data = getattr(filtered_data, method)(*arguments)
+    for column in columns:
+        filtered_data._check_units(column)
+    # collect once, so that plotting and displaying the data do not repeat the query
+    projected_data = filtered_data.base_dataframe.select(columns)
+    if isinstance(projected_data, pl.LazyFrame):
+        projected_data = projected_data.collect()
+    return filtered_data.clean_copy(
+        projected_data, column_definitions=filtered_data.column_definitions
+    )
+
+
+@st.fragment
+def render_plots(
+    cell_list: List[Cell],
+    path: str,
+    modified_time: float,
+    selected_indices: List[int],
+    selected_names: List[str],
+    procedure_name: Optional[str],
+    experiment_names: Tuple[str, ...],
+    cycle_step_input: str,
+) -> None:
+    """Draw the plot and data tables for the selected data.
+
+    This is run as a Streamlit fragment, so changing the plot axes only reruns this
+    function rather than the whole dashboard.
+
+    Args:
+        cell_list (List[Cell]): The list of cells in the dashboard.
+        path (str): The path to the pickled cell list.
+        modified_time (float): The modification time of the pickled cell list.
+        selected_indices (List[int]): The indices of the selected cells.
+        selected_names (List[str]): The names of the selected cells.
+        procedure_name (Optional[str]):
+            The name of the selected procedure, if there is one.
+        experiment_names (Tuple[str, ...]): The names of the selected experiments.
+        cycle_step_input (str): The filter string provided by the user.
+    """
+    x_options = [
+        "Time [s]",
+        "Time [min]",
+        "Time [hr]",
+        "Capacity [Ah]",
+        "Capacity [mAh]",
+        "Capacity Throughput [Ah]",
+    ]
+    y_options = [
+        "Voltage [V]",
+        "Current [A]",
+        "Current [mA]",
+        "Capacity [Ah]",
+        "Capacity [mAh]",
+    ]
+
+    graph_placeholder = st.empty()
+
+    col1, col2, col3, col4 = st.columns(4)
+    # Create select boxes for the x and y axes
+    filter_stage = col1.selectbox(
+        "Filter stage", ["", "Experiment", "Cycle", "Step"], index=0
+    )
+    x_axis = col2.selectbox("x axis", x_options, index=0)
+    x_axis = f"{filter_stage} {x_axis}".strip()
+    y_axis = str(col3.selectbox("y axis", y_options, index=1))
+    secondary_y_axis = col4.selectbox("Secondary y axis", ["None"] + y_options, index=0)
+
+    # Select plot theme
+
+    themes = list(plotly.io.templates)
+    themes.remove("none")
+    themes.remove("streamlit")
+    themes.insert(0, "default")
+    plot_theme = "simple_white"
+
+    if secondary_y_axis == "None":
+        secondary_y_axis = None
+
+    table_columns = [
+        "Time [s]",
+        "Step",
+        "Current [A]",
+        "Voltage [V]",
+        "Capacity [Ah]",
+    ]
+    plot_columns = [x_axis, y_axis]
+    if secondary_y_axis is not None:
+        plot_columns.append(secondary_y_axis)
+    selected_columns = tuple(dict.fromkeys(plot_columns + table_columns))
+
+    # Filter the data for each selected cell once
+    selected_data: List[Result] = []
+    if procedure_name is not None:
+        # Check if the input is not empty
+        filters = _parse_filter(cycle_step_input) if cycle_step_input else ()
+        selected_data = [
+            filter_data(
+                cell_list,
+                path,
+                modified_time,
+                selected_index,
+                procedure_name,
+                experiment_names,
+                filters,
+                selected_columns,
+            )
+            for selected_index in selected_indices
+        ]
+
+    # Create a figure
+    fig = Plot()
+    for filtered_data in selected_data:
+        plot_data = downsample(filtered_data, x_axis, y_axis, secondary_y_axis)
+        fig = fig.add_line(plot_data, x_axis, y_axis, secondary_y=secondary_y_axis)
+
+    # Show the plot
+    if len(selected_data) > 0:
+        graph_placeholder.plotly_chart(
+            fig.fig, theme="streamlit" if plot_theme == "default" else None
+        )
+
+    # Show raw data in tabs
+    if selected_data:
+        tabs = st.tabs(selected_names)
+        for i, tab in enumerate(tabs):
+            tab.dataframe(selected_data[i].data.select(table_columns), hide_index=True)
+
+
+if __name__ == "__main__":
+    dashboard_data_path = "dashboard_data.pkl"
+    dashboard_data_modified_time = os.path.getmtime(dashboard_data_path)
+    cell_list = load_cell_list(dashboard_data_path, dashboard_data_modified_time)
+
+    st.title("PyProBE Dashboard")
+    st.sidebar.title("Select data to plot")
+
+    info = pl.DataFrame([cell.info for cell in cell_list])
+
+    def dataframe_with_selections(df: pl.DataFrame) -> List[int]:
+        """Create a dataframe with a selection column for user input.
+
+        Args:
+            df (pd.DataFrame): The dataframe to display.
+
+        Returns:
+            list: The list of selected row indices.
+        """
+        # to_pandas already returns a new frame, so the selection column can be
+        # inserted without copying it again
+        df_with_selections = df.to_pandas()
+        df_with_selections.insert(0, "Select", False)
+
+        # Get dataframe row-selections from user with st.data_editor
+        edited_df = st.sidebar.data_editor(
+            df_with_selections,
+            hide_index=True,  # Keep the index visible
+            column_config={"Select": st.column_config.CheckboxColumn(required=True)},
+            disabled=df.columns,
+        )
+
+        # Filter the dataframe using the temporary column, then drop the column
+        selected_rows = edited_df[edited_df.Select]
+        selected_indices = (
+            selected_rows.index.tolist()
+        )  # Get the indices of the selected rows
+        return selected_indices
+
+    # Display the DataFrame in the sidebar
+    selected_indices = dataframe_with_selections(info)
+    # Get the names of the selected rows
+    selected_names = [str(cell_list[i].info["Name"]) for i in selected_indices]
+    # Get the procedure names from the selected cells
+    procedure_names_sets = [
+        OrderedSet(cell_list[i].procedure.keys()) for i in selected_indices
+    ]
+
+    # Find the common procedure names
+    if len(procedure_names_sets) == 0:
+        procedure_names: List[str] = []
+    else:
+        procedure_names = list(procedure_names_sets[0])
+        for s in procedure_names_sets[1:]:
+            procedure_names = [x for x in procedure_names if x in s]
+    procedure_names = list(procedure_names)
+    selected_raw_data = st.sidebar.selectbox("Select a procedure", procedure_names)
+
+    # Select an experiment
+    selected_experiment_tuple: Tuple[str, ...] = ()
+    if selected_raw_data is not None:
+        experiment_names = (
+            cell_list[selected_indices[0]].procedure[selected_raw_data].experiment_names
+        )
+        selected_experiment = st.sidebar.multiselect(
+            "Select an experiment", experiment_names
+        )
+        selected_experiment_tuple = tuple(selected_experiment)
+
+    # Get the cycle and step numbers from the user
+    cycle_step_input = st.sidebar.text_input(
+        'Enter the cycle and step numbers (e.g., "cycle(1).step(2)")'
+    )
+    render_plots(
+        cell_list,
+        dashboard_data_path,
+        dashboard_data_modified_time,
+        selected_indices,
+        selected_names,
+        selected_raw_data,
+        selected_experiment_tuple,
+        cycle_step_input,
+    )
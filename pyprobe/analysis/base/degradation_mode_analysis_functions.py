@@ -70,25 +70,34 @@ def ocv_curve_fit(
 
 
 def calc_electrode_capacities(
-    x_pe_lo: float,
-    x_pe_hi: float,
-    x_ne_lo: float,
-    x_ne_hi: float,
-    cell_capacity: float,
-) -> Tuple[float, float, float]:
+    x_pe_lo: float | NDArray[np.float64],
+    x_pe_hi: float | NDArray[np.float64],
+    x_ne_lo: float | NDArray[np.float64],
+    x_ne_hi: float | NDArray[np.float64],
+    cell_capacity: float | NDArray[np.float64],
+) -> Tuple[
+    float | NDArray[np.float64],
+    float | NDArray[np.float64],
+    float | NDArray[np.float64],
+]:
     """Calculate the electrode capacities.
 
+    The calculation is elementwise, so arrays of stoichiometry limits and cell
+    capacities can be passed to calculate the electrode capacities of many fits at
+    once.
+
     Args:
-        x_pe_lo (float): The cathode stoichiometry at lowest cell SOC.
-        x_pe_hi (float): The cathode stoichiometry at highest cell SOC.
-        x_ne_lo (float): The anode stoichiometry at lowest cell SOC.
-        x_ne_hi (float): The anode stoichiometry at highest cell SOC.
+        x_pe_lo (float | NDArray): The cathode stoichiometry at lowest cell SOC.
+        x_pe_hi (float | NDArray): The cathode stoichiometry at highest cell SOC.
+        x_ne_lo (float | NDArray): The anode stoichiometry at lowest cell SOC.
+        x_ne_hi (float | NDArray): The anode stoichiometry at highest cell SOC.
+        cell_capacity (float | NDArray): The cell capacity.
 
     Returns:
-        Tuple[float, float, float]:
-            - NDArray: The cathode capacity.
-            - NDArray: The anode capacity.
-            - NDArray: The lithium inventory.
+        Tuple[float | NDArray, float | NDArray, float | NDArray]:
+            - The cathode capacity.
+            - The anode capacity.
+            - The lithium inventory.
     """
     pe_capacity = cell_capacity / (x_pe_lo - x_pe_hi)
     ne_capacity = cell_capacity / (x_ne_hi - x_ne_lo)
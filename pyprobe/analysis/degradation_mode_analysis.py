@@ -493,6 +493,60 @@ def _build_objective_function(
     return _objective_function
 
 
+def _build_objective_gradient(
+    ocp_pe: OCP,
+    ocp_ne: OCP,
+    SOC: NDArray[np.float64],
+    fitting_target_data: NDArray[np.float64],
+) -> Callable[[NDArray[np.float64]], NDArray[np.float64]]:
+    """Get the gradient of the OCV objective function for single-component electrodes.
+
+    Each stoichiometry limit enters the full cell OCV linearly through the electrode
+    stoichiometry, so the gradient follows from the chain rule:
+    d(OCV)/d(x_pe_lo) = d(OCP_pe)/d(z_pe) * (1 - SOC)
+    d(OCV)/d(x_pe_hi) = d(OCP_pe)/d(z_pe) * SOC
+    and likewise for the negative electrode with the opposite sign.
+
+    Args:
+        ocp_pe: An object representing the positive electrode OCP.
+        ocp_ne: An object representing the negative electrode OCP.
+        SOC: The full cell SOC.
+        fitting_target_data: The OCV data to fit.
+
+    Returns:
+        A function returning the gradient of the objective function with respect to
+        [x_pe_lo, x_pe_hi, x_ne_lo, x_ne_hi].
+    """
+
+    def _objective_gradient(
+        params: NDArray[np.float64],
+    ) -> NDArray[np.float64]:
+        """Gradient of the objective function for the OCV curve fitting.
+
+        Args:
+            params: The fitting parameters.
+
+        Returns:
+            The gradient of the sum of squared residuals.
+        """
+        x_pe_lo, x_pe_hi, x_ne_lo, x_ne_hi = params
+        z_pe = x_pe_lo + (x_pe_hi - x_pe_lo) * SOC
+        z_ne = x_ne_lo + (x_ne_hi - x_ne_lo) * SOC
+        residuals = ocp_pe.eval(z_pe) - ocp_ne.eval(z_ne) - fitting_target_data
+        weighted_grad_pe = 2 * residuals * ocp_pe.grad(z_pe)
+        weighted_grad_ne = -2 * residuals * ocp_ne.grad(z_ne)
+        return np.array(
+            [
+                np.sum(weighted_grad_pe * (1 - SOC)),
+                np.sum(weighted_grad_pe * SOC),
+                np.sum(weighted_grad_ne * (1 - SOC)),
+                np.sum(weighted_grad_ne * SOC),
+            ]
+        )
+
+    return _objective_gradient
+
+
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
 def run_ocv_curve_fit(
     input_data: PyProBEDataType,
@@ -575,6 +629,21 @@ def run_ocv_curve_fit(
         "differential_evolution": optimize.differential_evolution,
     }[optimizer]
 
+    if (
+        optimizer == "minimize"
+        and fitting_target == "OCV"
+        and not (composite_pe or composite_ne)
+        and "jac" not in optimizer_options
+    ):
+        # avoid estimating the gradient by finite differences, which requires an
+        # extra objective function evaluation per fitting parameter
+        optimizer_options = {
+            **optimizer_options,
+            "jac": _build_objective_gradient(
+                cast(OCP, ocp_pe), cast(OCP, ocp_ne), SOC, fitting_target_data
+            ),
+        }
+
     results = selected_optimizer(objective_function, **optimizer_options).x
 
     x_pe_lo, x_pe_hi, x_ne_lo, x_ne_hi = results[:4]
@@ -976,12 +1045,13 @@ def average_ocvs(
         charge_result = input_data.charge()
     else:
         charge_result = eval(f"input_data.{charge_filter}")
-    charge_SOC = charge_result.get_only("SOC")
-    charge_OCV = charge_result.get_only("Voltage [V]")
-    charge_current = charge_result.get_only("Current [A]")
-    discharge_SOC = discharge_result.get_only("SOC")
-    discharge_OCV = discharge_result.get_only("Voltage [V]")
-    discharge_current = discharge_result.get_only("Current [A]")
+    # retrieve all columns of each result together, so that each is only collected once
+    charge_SOC, charge_OCV, charge_current, charge_capacity = charge_result.get(
+        "SOC", "Voltage [V]", "Current [A]", "Capacity [Ah]"
+    )
+    discharge_SOC, discharge_OCV, discharge_current = discharge_result.get(
+        "SOC", "Voltage [V]", "Current [A]"
+    )
 
     average_OCV = dma_functions.average_OCV_curves(
         charge_SOC,
@@ -996,7 +1066,7 @@ def average_ocvs(
         pl.DataFrame(
             {
                 "Voltage [V]": average_OCV,
-                "Capacity [Ah]": charge_result.get_only("Capacity [Ah]"),
+                "Capacity [Ah]": charge_capacity,
                 "SOC": charge_SOC,
             }
         )
@@ -2,6 +2,7 @@
 
 from typing import List
 
+import numpy as np
 import polars as pl
 from deprecated import deprecated
 from pydantic import BaseModel, validate_call
@@ -143,73 +144,40 @@ def get_resistances(
     )
     pulse_df = pulse_df.with_columns(R0)
 
-    t_col_names = [f"t_{time}s [s]" for time in r_times]
     r_t_col_names = [f"R_{time}s [Ohms]" for time in r_times]
-    if t_col_names != []:
-        # add columns for the timestamps requested after each pulse
-        pulse_df = pulse_df.with_columns(
-            [
-                (pl.col("Start Time [s]") + time).alias(t_col_names[idx])
-                for idx, time in enumerate(r_times)
-            ]
-        )
-
-        # reformat df into two rows, r_time and the corresponding timestamp
-        t_after_pulse_df = pulse_df.unpivot(t_col_names).rename(
-            {"variable": "r_time", "value": "Time [s]"}
+    if r_times:
+        if isinstance(pulse_df, pl.LazyFrame):
+            pulse_df = pulse_df.collect()
+        time, voltage = input_data.get("Time [s]", "Voltage [V]")
+        start_time = pulse_df.get_column("Start Time [s]").to_numpy()
+        # linearly interpolate the voltage at every requested time after every pulse
+        # in a single call, times outside of the data range give null values
+        r_t_voltages = np.interp(
+            np.add.outer(start_time, r_times),
+            time,
+            voltage,
+            left=np.nan,
+            right=np.nan,
         )
-
-        # merge this dataframe into the full dataframe and sort
-        t_after_pulse_df = all_data_df.join(
-            t_after_pulse_df, on="Time [s]", how="full", coalesce=True
-        ).sort("Time [s]")
-
-        # after merging, where the requested time doesn't match with an existing
-        # timestamp, null values will be inserted in the Voltage and Event columns.
-        # Use linear interpolation for voltage and just look backward for the event
-        # number
-        t_after_pulse_df = t_after_pulse_df.with_columns(
-            [
-                pl.col("Voltage [V]").interpolate(),
-            ]
+        pulse_df = pulse_df.with_columns(
+            (
+                (pl.Series(r_t_voltages[:, idx]).fill_nan(None) - pl.col("OCV [V]"))
+                / pl.col("Current [A]")
+            ).alias(r_t_col_name)
+            for idx, r_t_col_name in enumerate(r_t_col_names)
         )
-        # filter the array to return only the inserted rows
-        t_after_pulse_df = t_after_pulse_df.filter(
-            pl.col("r_time").is_not_null()
-        ).select("Voltage [V]", "Time [s]")
 
-        for time in r_times:
-            pulse_df = pulse_df.join(
-                t_after_pulse_df,
-                left_on=f"t_{time}s [s]",
-                right_on="Time [s]",
-                how="left",
-            ).rename({"Voltage [V]_right": f"V_{time}s [V]"})
-            pulse_df = pulse_df.with_columns(
-                (pl.col(f"V_{time}s [V]") - pl.col("OCV [V]")) / pl.col("Current [A]")
-            ).rename({f"V_{time}s [V]": f"R_{time}s [Ohms]"})
-
-        # filter the dataframe to the final selection
-        pulse_df = pulse_df.select(
-            [
-                "Pulse Number",
-                "Experiment Capacity [Ah]",
-                "SOC",
-                "OCV [V]",
-                "R0 [Ohms]",
-            ]
-            + r_t_col_names
-        )
-    else:
-        pulse_df = pulse_df.select(
-            [
-                "Pulse Number",
-                "Experiment Capacity [Ah]",
-                "SOC",
-                "OCV [V]",
-                "R0 [Ohms]",
-            ]
-        )
+    # filter the dataframe to the final selection
+    pulse_df = pulse_df.select(
+        [
+            "Pulse Number",
+            "Experiment Capacity [Ah]",
+            "SOC",
+            "OCV [V]",
+            "R0 [Ohms]",
+        ]
+        + r_t_col_names
+    )
 
     column_definitions = {
         "Pulse Number": "An index for each pulse.",
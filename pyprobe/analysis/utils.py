@@ -17,9 +17,25 @@ def assemble_array(input_data: List[Result], name: str) -> NDArray[Any]:
         name (str): The name of the variable.
 
     Returns:
-        NDArray: The assembled array.
+        NDArray: The assembled array, with one row per result.
+
+    Raises:
+        ValueError: If no results are provided.
+        ValueError: If the variable does not have the same length in every result.
     """
-    return np.vstack([input.get_only(name) for input in input_data])
+    if len(input_data) == 0:
+        raise ValueError("At least one result must be provided.")
+    rows = [input.get_only(name) for input in input_data]
+    for index, row in enumerate(rows[1:], start=1):
+        if row.size != rows[0].size:
+            raise ValueError(
+                f"Variable '{name}' has a different length in result {index}."
+            )
+    # copy each row directly into a preallocated array of the common dtype of the rows
+    assembled_array = np.empty((len(rows), rows[0].size), np.result_type(*rows))
+    for index, row in enumerate(rows):
+        assembled_array[index] = row
+    return assembled_array
 
 
 class AnalysisValidator(BaseModel):
@@ -45,9 +61,10 @@ class AnalysisValidator(BaseModel):
         Raises:
             ValueError: If any of the required columns are missing.
         """
+        column_set = set(self.input_data.column_list)
         missing_columns = []
         for col in self.required_columns:
-            if col not in self.input_data.column_list:
+            if col not in column_set:
                 try:
                     self.input_data._check_units(col)
                 except ValueError:
@@ -1,4 +1,5 @@
 """Module for the Cell class."""
+import glob
 import json
 import os
 import shutil
@@ -69,6 +70,7 @@ class Cell(BaseModel):
         input_filename: str | Callable[[str], str],
         output_filename: str | Callable[[str], str],
         filename_inputs: Optional[List[str]] = None,
+        overwrite_existing: bool = True,
     ) -> None:
         """Convert cycler file into PyProBE format.
 
@@ -89,6 +91,12 @@ class Cell(BaseModel):
             filename_inputs (list):
                 The list of inputs to input_filename and output_filename, if they are
                 functions. These must be keys of the cell info.
+            overwrite_existing (bool):
+                If False, the conversion is skipped when the output parquet file
+                already exists and is newer than all of the input files. Only the file
+                modification times are compared, so this must be True to convert the
+                data again after changing any of the other arguments. Defaults to
+                True.
         """
         input_data_path = self._get_data_paths(
             folder_path, input_filename, filename_inputs
@@ -100,6 +108,12 @@ class Cell(BaseModel):
         if "*" in output_data_path:
             raise ValueError("* characters are not allowed for a complete data path.")
 
+        if not overwrite_existing and self._output_is_up_to_date(
+            input_data_path, output_data_path
+        ):
+            print(f"\t{output_data_path} is up to date, conversion skipped.")
+            return
+
         cycler_dict = {
             "neware": neware.Neware,
             "biologic": biologic.Biologic,
@@ -121,6 +135,7 @@ class Cell(BaseModel):
         output_filename: str | Callable[[str], str],
         column_dict: Dict[str, str],
         filename_inputs: Optional[List[str]] = None,
+        overwrite_existing: bool = True,
     ) -> None:
         """Convert generic file into PyProBE format.
 
@@ -142,6 +157,12 @@ class Cell(BaseModel):
             filename_inputs (list):
                 The list of inputs to input_filename and output_filename.
                 These must be keys of the cell info.
+            overwrite_existing (bool):
+                If False, the conversion is skipped when the output parquet file
+                already exists and is newer than all of the input files. Only the file
+                modification times are compared, so this must be True to convert the
+                data again after changing any of the other arguments. Defaults to
+                True.
         """
         input_data_path = self._get_data_paths(
             folder_path, input_filename, filename_inputs
@@ -153,6 +174,12 @@ class Cell(BaseModel):
         if "*" in output_data_path:
             raise ValueError("* characters are not allowed for a complete data path")
 
+        if not overwrite_existing and self._output_is_up_to_date(
+            input_data_path, output_data_path
+        ):
+            print(f"\t{output_data_path} is up to date, conversion skipped.")
+            return
+
         t1 = time.time()
         importer = basecycler.BaseCycler(
             input_data_path=input_data_path,
@@ -222,6 +249,32 @@ class Cell(BaseModel):
             filename = os.path.splitext(filename)[0] + ".parquet"
         return filename
 
+    @staticmethod
+    def _output_is_up_to_date(input_data_path: str, output_data_path: str) -> bool:
+        """Check whether a PyProBE parquet file is newer than its input files.
+
+        The arguments used to produce the parquet file are not stored, so a file
+        produced with a different cycler or column dictionary is still considered up
+        to date.
+
+        Args:
+            input_data_path (str):
+                The path to the input data. May contain a * wildcard for multiple files.
+            output_data_path (str): The path to the PyProBE parquet file.
+
+        Returns:
+            bool:
+                True if the parquet file exists and was modified after all of the
+                input files.
+        """
+        if not os.path.exists(output_data_path):
+            return False
+        input_files = glob.glob(input_data_path)
+        output_modified_time = os.path.getmtime(output_data_path)
+        return len(input_files) > 0 and all(
+            os.path.getmtime(file) <= output_modified_time for file in input_files
+        )
+
     def _write_parquet(
         self,
         importer: basecycler.BaseCycler,
@@ -229,13 +282,18 @@ class Cell(BaseModel):
     ) -> None:
         """Import data from a cycler file and write to a PyProBE parquet file.
 
+        Lazy data is collected with the streaming engine, so that the file scans and
+        column conversions are processed in batches rather than holding all of the raw
+        cycler data in memory. Operations that cannot be streamed, such as the
+        cumulative sums over the whole dataset, fall back to the in-memory engine.
+
         Args:
             importer (BaseCycler): The cycler object to import the data.
             output_data_path (str): The path to write the parquet file.
         """
         dataframe = importer.pyprobe_dataframe
         if isinstance(dataframe, pl.LazyFrame):
-            dataframe = dataframe.collect()
+            dataframe = dataframe.collect(streaming=True)
         dataframe.write_parquet(output_data_path)
 
     @staticmethod
@@ -417,16 +475,7 @@ class Cell(BaseModel):
                 pl.col("Terminal voltage [V]").alias("Voltage [V]"),
                 (pl.col("Discharge capacity [A.h]") * -1).alias("Capacity [Ah]"),
                 pl.col("Step"),
-                (
-                    (
-                        pl.col("Step").cast(pl.Int64)
-                        - pl.col("Step").cast(pl.Int64).shift()
-                        != 0
-                    )
-                    .fill_null(strategy="zero")
-                    .cum_sum()
-                    .alias("Event")
-                ),
+                pl.col("Step").rle_id().alias("Event"),
             ]
         )
         # create the procedure object
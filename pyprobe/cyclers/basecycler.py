@@ -3,13 +3,22 @@
 import glob
 import os
 import warnings
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import polars as pl
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, PrivateAttr, field_validator, model_validator
 
 from pyprobe.units import Units
 
+# The columns every cycler must provide, in column dictionary format and as the
+# quantities of the mapped columns
+_REQUIRED_COLUMN_PATTERNS = frozenset(
+    {"Time [*]", "Current [*]", "Voltage [*]", "Step", "Capacity [*]"}
+)
+_REQUIRED_QUANTITIES = frozenset({"Time", "Current", "Voltage", "Capacity", "Step"})
+
 
 class BaseCycler(BaseModel):
     """A class to load and process battery cycler data."""
@@ -25,6 +34,10 @@ class BaseCycler(BaseModel):
     documentation for more information on the format string.
     """
 
+    _pyprobe_expressions: Optional[Tuple[List[pl.Expr], List[pl.Expr]]] = PrivateAttr(
+        default=None
+    )
+
     @field_validator("input_data_path")
     @classmethod
     def _check_input_data_path(cls, value: str) -> str:
@@ -55,19 +68,11 @@ class BaseCycler(BaseModel):
         Returns:
             Dict[str, str]: The column dictionary.
         """
-        pyprobe_data_columns = {value for value in value.values()}
-        pyprobe_required_columns = {
-            "Time [*]",
-            "Current [*]",
-            "Voltage [*]",
-            "Step",
-            "Capacity [*]",
-        }
-        missing_columns = pyprobe_required_columns - pyprobe_data_columns
+        missing_columns = set(_REQUIRED_COLUMN_PATTERNS.difference(value.values()))
         extra_error_message = ""
         if "Capacity [*]" in missing_columns:
             if {"Charge Capacity [*]", "Discharge Capacity [*]"}.issubset(
-                pyprobe_data_columns
+                value.values()
             ):
                 missing_columns.remove("Capacity [*]")
             else:
@@ -89,9 +94,15 @@ class BaseCycler(BaseModel):
         """Import the data and validate the column mapping."""
         dataframe_list = self._get_dataframe_list()
         self._imported_dataframe = self.get_imported_dataframe(dataframe_list)
-        self._column_map = self._map_columns(
-            self.column_dict, self._imported_dataframe.collect_schema().names()
-        )
+        schema = self._imported_dataframe.collect_schema()
+        self._column_map = self._map_columns(self.column_dict, schema.names())
+        self._pyprobe_expressions = None
+        # keep dates that are already imported as datetimes, rather than parsing them
+        # from strings
+        if "Date" in self._column_map:
+            date_type = schema[str(self._column_map["Date"]["Cycler column name"])]
+            if date_type == pl.Datetime:
+                self._column_map["Date"]["Type"] = date_type
         self._check_missing_columns(self.column_dict, self._column_map)
         return self
 
@@ -111,16 +122,7 @@ class BaseCycler(BaseModel):
                 If any of ["Time", "Current", "Voltage", "Capacity", "Step"]
                 are missing.
         """
-        pyprobe_required_columns = set(
-            [
-                "Time",
-                "Current",
-                "Voltage",
-                "Capacity",
-                "Step",
-            ]
-        )
-        missing_columns = pyprobe_required_columns - set(column_map.keys())
+        missing_columns = set(_REQUIRED_QUANTITIES.difference(column_map.keys()))
         if missing_columns:
             if "Capacity" in missing_columns:
                 if (
@@ -132,15 +134,15 @@ class BaseCycler(BaseModel):
                     missing_columns.add("Charge Capacity")
                     missing_columns.add("Discharge Capacity")
         if len(missing_columns) > 0:
-            search_names = []
-            for column in missing_columns:
-                if column != "Step":
-                    full_name = column + " [*]"
-                else:
-                    full_name = column
-                for cycler_name, pyprobe_name in column_dict.items():
-                    if pyprobe_name == full_name:
-                        search_names.append(cycler_name)
+            missing_full_names = {
+                column + " [*]" if column != "Step" else column
+                for column in missing_columns
+            }
+            search_names = [
+                cycler_name
+                for cycler_name, pyprobe_name in column_dict.items()
+                if pyprobe_name in missing_full_names
+            ]
             raise ValueError(
                 f"PyProBE cannot find the following columns, please check your data: "
                 f"{search_names}."
@@ -160,7 +162,8 @@ class BaseCycler(BaseModel):
         file_ext = os.path.splitext(file)[1]
         match file_ext.lower():
             case ".xlsx":
-                return pl.read_excel(filepath, engine="calamine", infer_schema_length=0)
+                modified_time = os.stat(filepath).st_mtime_ns
+                return _read_excel(os.path.abspath(filepath), modified_time).clone()
             case ".csv":
                 return pl.scan_csv(filepath, infer_schema=False)
             case _:
@@ -177,28 +180,37 @@ class BaseCycler(BaseModel):
         """
         files = glob.glob(self.input_data_path)
         files.sort()
-        list = [self.read_file(file) for file in files]
-        all_columns = set([col for df in list for col in df.collect_schema().names()])
-        for i in range(len(list)):
-            if len(list[i].collect_schema().names()) < len(all_columns):
+        # read the files concurrently, as header parsing and file reads are I/O bound
+        with ThreadPoolExecutor(
+            max_workers=min(len(files), os.cpu_count() or 1)
+        ) as executor:
+            dataframes = list(executor.map(self.read_file, files))
+        # resolve the schema of each file once, as this can require reading the file
+        column_sets = [set(df.collect_schema().names()) for df in dataframes]
+        all_columns = set().union(*column_sets)
+        for file, columns in zip(files, column_sets):
+            if columns < all_columns:
                 warnings.warn(
-                    f"File {os.path.basename(files[i])} has missing columns, "
+                    f"File {os.path.basename(file)} has missing columns, "
                     "these have been filled with null values."
                 )
-        return list
+        return dataframes
 
     def get_imported_dataframe(
-        self, dataframe_list: List[pl.DataFrame]
-    ) -> pl.DataFrame:
+        self, dataframe_list: List[pl.DataFrame | pl.LazyFrame]
+    ) -> pl.DataFrame | pl.LazyFrame:
         """Return a single DataFrame from a list of DataFrames.
 
+        The DataFrames are not rechunked, as the imported data is only read once by the
+        lazy query in :attr:`pyprobe_dataframe`, which allocates new columns anyway.
+
         Args:
             dataframe_list: A list of DataFrames.
 
         Returns:
-            DataFrame: A single DataFrame.
+            pl.DataFrame | pl.LazyFrame: A single DataFrame.
         """
-        return pl.concat(dataframe_list, how="diagonal", rechunk=True)
+        return pl.concat(dataframe_list, how="diagonal", rechunk=False)
 
     @staticmethod
     def _match_unit(column_name: str, pattern: str) -> Optional[str]:
@@ -255,22 +267,29 @@ class BaseCycler(BaseModel):
                     Unit (str): The unit of the column.
                     Type (pl.DataType): The data type of the column.
         """
+        default_units = {
+            "Time": "s",
+            "Current": "A",
+            "Voltage": "V",
+            "Capacity": "Ah",
+            "Charge Capacity": "Ah",
+            "Discharge Capacity": "Ah",
+            "Temperature": "C",
+        }
+        column_set = set(dataframe_columns)
         column_map: Dict[str, Dict[str, str | pl.DataType]] = {}
         for cycler_format, pyprobe_format in column_dict.items():
-            for cycler_column_name in dataframe_columns:
+            # column names without a unit placeholder can only match exactly
+            if "*" in cycler_format:
+                candidate_columns = dataframe_columns
+            elif cycler_format in column_set:
+                candidate_columns = [cycler_format]
+            else:
+                continue
+            for cycler_column_name in candidate_columns:
                 unit = cls._match_unit(cycler_column_name, cycler_format)
                 if unit is not None:
                     quantity = pyprobe_format.replace(" [*]", "")
-                    default_units = {
-                        "Time": "s",
-                        "Current": "A",
-                        "Voltage": "V",
-                        "Capacity": "Ah",
-                        "Charge Capacity": "Ah",
-                        "Discharge Capacity": "Ah",
-                        "Temperature": "C",
-                    }
-
                     if quantity == "Temperature" and unit != "K":
                         unit = "C"
                     elif unit == "" and quantity in default_units:
@@ -339,31 +358,61 @@ class BaseCycler(BaseModel):
             .alias(column["PyProBE column name"])
         )
 
+    def _get_pyprobe_expressions(self) -> Tuple[List[pl.Expr], List[pl.Expr]]:
+        """Build the expressions to convert the imported data to the PyProBE format.
+
+        The expressions only depend on the column map, so they are built once and
+        reused until the data is imported and validated again.
+
+        Returns:
+            Tuple[List[pl.Expr], List[pl.Expr]]:
+                The expressions to rename and cast the cycler columns, and the
+                expressions to select the PyProBE columns.
+        """
+        if self._pyprobe_expressions is None:
+            name_converters = [
+                self._convert_names(quantity) for quantity in self._column_map.keys()
+            ]
+            required_columns = [
+                self.date if "Date" in self._column_map.keys() else None,
+                self.time,
+                self.step,
+                self.event,
+                self.current,
+                self.voltage,
+                self.capacity
+                if "Capacity" in self._column_map.keys()
+                else self.capacity_from_ch_dch,
+                self.temperature if "Temperature" in self._column_map.keys() else None,
+            ]
+            self._pyprobe_expressions = (
+                name_converters,
+                [col for col in required_columns if col is not None],
+            )
+        return self._pyprobe_expressions
+
     @property
-    def pyprobe_dataframe(self) -> pl.DataFrame:
+    def pyprobe_dataframe(self) -> pl.DataFrame | pl.LazyFrame:
         """The DataFrame containing the required columns.
 
+        The processing is always run as a lazy query, so that only the required columns
+        are converted and repeated expressions are evaluated once. The mapped cycler
+        columns are renamed and cast in a single projection, from which all of the
+        PyProBE columns are computed in one select. The result is collected only if the
+        imported data was already in memory.
+
         Returns:
-            pl.DataFrame: The DataFrame.
+            pl.DataFrame | pl.LazyFrame: The DataFrame.
         """
-        required_columns = [
-            self.date if "Date" in self._column_map.keys() else None,
-            self.time,
-            self.step,
-            self.event,
-            self.current,
-            self.voltage,
-            self.capacity
-            if "Capacity" in self._column_map.keys()
-            else self.capacity_from_ch_dch,
-            self.temperature if "Temperature" in self._column_map.keys() else None,
-        ]
-        name_converters = [
-            self._convert_names(quantity) for quantity in self._column_map.keys()
-        ]
-        imported_dataframe = self._imported_dataframe.with_columns(name_converters)
-        required_columns = [col for col in required_columns if col is not None]
-        return imported_dataframe.select(required_columns)
+        name_converters, required_columns = self._get_pyprobe_expressions()
+        pyprobe_dataframe = (
+            self._imported_dataframe.lazy()
+            .select(name_converters)
+            .select(required_columns)
+        )
+        if isinstance(self._imported_dataframe, pl.DataFrame):
+            return pyprobe_dataframe.collect()
+        return pyprobe_dataframe
 
     @property
     def date(self) -> pl.Expr:
@@ -372,6 +421,8 @@ class BaseCycler(BaseModel):
         Returns:
             pl.Expr: A polars expression for the date column.
         """
+        if self._column_map["Date"]["Type"] == pl.Datetime:
+            return pl.col("Date").cast(pl.Datetime(time_unit="us"))
         return (
             pl.col("Date")
             .str.strip_chars()
@@ -431,21 +482,23 @@ class BaseCycler(BaseModel):
     def capacity_from_ch_dch(self) -> pl.Expr:
         """Calculate the capacity from charge and discharge capacities.
 
+        The charge and discharge capacity expressions are built once and reused, so
+        that polars can evaluate each of them a single time in the query.
+
         Returns:
             pl.Expr: A polars expression for the capacity column.
         """
+        charge_capacity = self.charge_capacity
+        discharge_capacity = self.discharge_capacity
         diff_charge_capacity = (
-            self.charge_capacity.diff().clip(lower_bound=0).fill_null(strategy="zero")
+            charge_capacity.diff().clip(lower_bound=0).fill_null(strategy="zero")
         )
-
         diff_discharge_capacity = (
-            self.discharge_capacity.diff()
-            .clip(lower_bound=0)
-            .fill_null(strategy="zero")
+            discharge_capacity.diff().clip(lower_bound=0).fill_null(strategy="zero")
         )
         return (
             (diff_charge_capacity - diff_discharge_capacity).cum_sum()
-            + self.charge_capacity.max()
+            + charge_capacity.max()
         ).alias("Capacity [Ah]")
 
     @property
@@ -482,14 +535,29 @@ class BaseCycler(BaseModel):
         """Identify the event number.
 
         Events are defined by any change in the step number, increase or decrease.
+        Event numbers are never negative, so they are stored as 32-bit unsigned
+        integers.
 
         Returns:
             pl.Expr: A polars expression for the event number.
         """
-        return (
-            (pl.col("Step").cast(pl.Int64) - pl.col("Step").cast(pl.Int64).shift() != 0)
-            .fill_null(strategy="zero")
-            .cum_sum()
-            .alias("Event")
-            .cast(pl.Int64)
-        )
+        return pl.col("Step").cast(pl.Int64).rle_id().alias("Event").cast(pl.UInt32)
+
+
+@lru_cache(maxsize=1)
+def _read_excel(filepath: str, modified_time: int) -> pl.DataFrame:
+    """Read an Excel file, caching the result until the file is modified.
+
+    Only the most recently read file is kept, so that repeated reads of one file are
+    not parsed again, without holding on to every workbook read in a batch.
+
+    Args:
+        filepath (str): The absolute path to the file.
+        modified_time (int):
+            The modification time of the file in nanoseconds. Only used as part of
+            the cache key, so that a file is re-read if it has been overwritten.
+
+    Returns:
+        pl.DataFrame: The DataFrame, with all columns read as strings.
+    """
+    return pl.read_excel(filepath, engine="calamine", infer_schema_length=0)
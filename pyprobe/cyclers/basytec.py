@@ -34,11 +34,13 @@ class Basytec(BaseCycler):
         """
         n_header_lines = 0
         with open(filepath, "r", encoding="utf-8") as file:
+            # the header lines all precede the data, so stop at the first data line
             for line in file:
-                if line.startswith("~"):
-                    n_header_lines += 1
-                    if line.startswith("~Start of Test"):
-                        start_time_line = line
+                if not line.startswith("~"):
+                    break
+                n_header_lines += 1
+                if line.startswith("~Start of Test"):
+                    start_time_line = line
 
         _, value = start_time_line.split(": ")
         start_time = datetime.strptime(value.strip(), "%d.%m.%Y %H:%M:%S")
@@ -38,11 +38,10 @@ class Biologic(BaseCycler):
         with open(filepath, "r", encoding="iso-8859-1") as file:
             file.readline()  # Skip the first line
             second_line = file.readline().strip()  # Read the second line
-        _, value = second_line.split(":")
-        n_header_lines = int(value.strip())
-
-        with open(filepath, "r", encoding="iso-8859-1") as file:
-            for i in range(n_header_lines):
+            _, value = second_line.split(":")
+            n_header_lines = int(value.strip())
+            # continue through the remaining header lines in the same pass
+            for _ in range(n_header_lines - 2):
                 line = file.readline()
                 if "Acquisition started on" in line:
                     start_time_line = line
@@ -55,9 +54,9 @@ class Biologic(BaseCycler):
         )
 
         dataframe = dataframe.with_columns(
-            (pl.col("time/s").cast(pl.Float64).cast(pl.Duration) + pl.lit(start_time))
-            .cast(str)
-            .alias("Date")
+            (
+                pl.col("time/s").cast(pl.Float64).cast(pl.Duration) + pl.lit(start_time)
+            ).alias("Date")
         )
         return dataframe
 
@@ -66,7 +65,7 @@ class BiologicMB(Biologic):
     """A class to load and process Biologic Modulo Bat  battery cycler data."""
 
     def get_imported_dataframe(
-        self, dataframe_list: List[pl.DataFrame]
+        self, dataframe_list: List[pl.DataFrame | pl.LazyFrame]
     ) -> pl.DataFrame | pl.LazyFrame:
         """Read a battery cycler file into a DataFrame.
 
@@ -91,7 +90,10 @@ class BiologicMB(Biologic):
         """Correct the step column.
 
         This method adds the maximum step number from the previous MB file to the step
-        number of the following MB file so they monotonically increase.
+        number of the following MB file so they monotonically increase. The offsets are
+        computed with window expressions rather than a join, which relies on the rows
+        of each MB file being contiguous and in file order, as they are when
+        concatenated in :meth:`get_imported_dataframe`.
 
         Args:
             df: The DataFrame to correct.
@@ -99,19 +101,11 @@ class BiologicMB(Biologic):
         Returns:
             pl.DataFrame: The corrected DataFrame.
         """
+        step = pl.col("Ns").cast(pl.Int64)
         # get the max step number for each MB file and add 1
-        max_steps = df.group_by("MB File").agg(
-            (pl.col("Ns").cast(pl.Int64).max() + 1).alias("Max_Step")
-        )
-        # sort the max steps by MB file
-        max_steps = max_steps.sort("MB File")
-        # get the cumulative sum of the max steps
-        max_steps = max_steps.with_columns(pl.col("Max_Step").cum_sum())
-        # add 1 to the MB file number to offset the join
-        max_steps = max_steps.with_columns(pl.col("MB File") + 1)
-        # join the max step number to the original dataframe and fill nulls with 0
-        df_with_max_step = df.join(max_steps, on="MB File", how="left").fill_null(0)
-        # add the max step number to the step number
-        return df_with_max_step.with_columns(
-            pl.col("Ns").cast(pl.Int64) + pl.col("Max_Step")
-        )
+        max_step = step.max().over("MB File") + 1
+        # at the first row of each MB file, take the max step of the previous file
+        file_start = pl.col("MB File") != pl.col("MB File").shift()
+        step_offset = pl.when(file_start).then(max_step.shift()).otherwise(0)
+        # the cumulative sum gives the total offset for each MB file
+        return df.with_columns(step + step_offset.fill_null(0).cum_sum())
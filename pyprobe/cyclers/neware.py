@@ -34,28 +34,20 @@ class Neware(BaseCycler):
             pl.DataFrame | pl.LazyFrame: The DataFrame.
         """
         dataframe = BaseCycler.read_file(filepath)
-        if "Time" in dataframe.collect_schema().names():
+        column_names = dataframe.collect_schema().names()
+        time_columns = [
+            column for column in ["Time", "Total Time"] if column in column_names
+        ]
+        if time_columns:
+            # parse all time columns in one projection, then offset them in another
             dataframe = dataframe.with_columns(
-                pl.col("Time")
+                pl.col(time_columns)
                 .str.strptime(pl.Datetime, format="%Y-%m-%d %H:%M:%S%.f")
                 .cast(pl.Float64)
-                .alias("Time")
             )
             dataframe = dataframe.with_columns(
-                pl.col("Time") - pl.col("Time").first().alias("Time")
+                (pl.col(time_columns) - pl.col(time_columns).first()) / 1e6
             )
-            dataframe = dataframe.with_columns(pl.col("Time") / 1e6)
-        if "Total Time" in dataframe.collect_schema().names():
-            dataframe = dataframe.with_columns(
-                pl.col("Total Time")
-                .str.strptime(pl.Datetime, format="%Y-%m-%d %H:%M:%S%.f")
-                .cast(pl.Float64)
-                .alias("Total Time")
-            )
-            dataframe = dataframe.with_columns(
-                pl.col("Total Time") - pl.col("Total Time").first().alias("Total Time")
-            )
-            dataframe = dataframe.with_columns(pl.col("Total Time") / 1e6)
         return dataframe
 
     @property
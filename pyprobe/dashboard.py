@@ -1,18 +1,18 @@
-"""Script to create a Streamlit dashboard for PyProBE."""
-import copy
+"""Functions to launch and prepare data for the PyProBE Streamlit dashboard."""
+import ast
 import os
 import pickle
 import platform
 import subprocess
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
-import plotly
+import numpy as np
 import polars as pl
-import streamlit as st
-from ordered_set import OrderedSet
+from numpy.typing import NDArray
 
 from pyprobe.cell import Cell
-from pyprobe.plot import Plot
+from pyprobe.result import Result
 
 
 def launch_dashboard(cell_list: List[Cell]) -> None:
@@ -33,7 +33,7 @@ def launch_dashboard(cell_list: List[Cell]) -> None:
                 "/B",
                 "streamlit",
                 "run",
-                os.path.join(os.path.dirname(__file__), "dashboard.py"),
+                os.path.join(os.path.dirname(__file__), "_dashboard_app.py"),
                 ">",
                 "nul",
                 "2>&1",
@@ -46,165 +46,149 @@ def launch_dashboard(cell_list: List[Cell]) -> None:
                 "nohup",
                 "streamlit",
                 "run",
-                os.path.join(os.path.dirname(__file__), "dashboard.py"),
+                os.path.join(os.path.dirname(__file__), "_dashboard_app.py"),
             ],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.STDOUT,
         )
 
 
-if __name__ == "__main__":
-    with open("dashboard_data.pkl", "rb") as f:
-        cell_list = pickle.load(f)
+def _min_max_indices(y: NDArray[np.float64], n_buckets: int) -> NDArray[np.int64]:
+    """Return the indices of the minimum and maximum value in each bucket of an array.
 
-    st.title("PyProBE Dashboard")
-    st.sidebar.title("Select data to plot")
+    Args:
+        y (NDArray[np.float64]): The array to bucket.
+        n_buckets (int): The maximum number of buckets to split the array into.
 
-    info_list = []
-    for i in range(len(cell_list)):
-        info_list.append(cell_list[i].info)
-    info = pl.DataFrame(info_list)
+    Returns:
+        NDArray[np.int64]: The indices of the minimum and maximum of each bucket.
+    """
+    n_points = len(y)
+    bucket_size = -(-n_points // n_buckets)
+    n_buckets = -(-n_points // bucket_size)
+    offsets = np.arange(n_buckets) * bucket_size
+
+    # pad the final bucket so that the array can be reshaped, NaN values are never
+    # selected as the minimum or maximum
+    for_min = np.full(n_buckets * bucket_size, np.inf)
+    for_max = np.full(n_buckets * bucket_size, -np.inf)
+    for_min[:n_points] = np.where(np.isnan(y), np.inf, y)
+    for_max[:n_points] = np.where(np.isnan(y), -np.inf, y)
+    idx_min = np.argmin(for_min.reshape(n_buckets, bucket_size), axis=1) + offsets
+    idx_max = np.argmax(for_max.reshape(n_buckets, bucket_size), axis=1) + offsets
+    return np.concatenate([idx_min, idx_max])
+
+
+def downsample(
+    result: Result,
+    x: str,
+    y: str,
+    secondary_y: Optional[str] = None,
+    n_out: int = 2500,
+) -> Result:
+    """Reduce the number of points in a result before it is plotted.
+
+    The data is split into equal buckets and the points with the minimum and maximum
+    y value are kept from each bucket, so that peaks in the data are preserved. Only
+    the plotted columns are returned.
 
-    def dataframe_with_selections(df: pl.DataFrame) -> List[int]:
-        """Create a dataframe with a selection column for user input.
+    Args:
+        result (Result): The result to downsample.
+        x (str): The x-axis column.
+        y (str): The y-axis column.
+        secondary_y (Optional[str]): The secondary y-axis column.
+        n_out (int): The approximate number of points to keep for each y column.
+
+    Returns:
+        Result: A result containing the plotted columns at reduced resolution.
+    """
+    y_columns = [y] if secondary_y is None else [y, secondary_y]
+    columns = list(dict.fromkeys([x] + y_columns))
+    arrays = result.get(*columns)
+    if isinstance(arrays, np.ndarray):
+        arrays = (arrays,)
+    data = dict(zip(columns, arrays))
+    n_points = len(arrays[0])
+    if n_points > n_out:
+        indices = [np.array([0, n_points - 1])]
+        for column in y_columns:
+            indices.append(_min_max_indices(data[column], n_out // 2))
+        keep = np.unique(np.concatenate(indices))
+        data = {column: array[keep] for column, array in data.items()}
+    return result.clean_copy(
+        pl.DataFrame(data),
+        column_definitions=result.column_definitions,
+    )
 
-        Args:
-            df (pd.DataFrame): The dataframe to display.
 
-        Returns:
-            list: The list of selected row indices.
-        """
-        df = df.to_pandas()
-        df_with_selections = copy.deepcopy(df)
-        df_with_selections.insert(0, "Select", False)
+def _parse_filter_argument(node: ast.expr) -> int | range:
+    """Convert an argument of a filter method into an integer or range.
 
-        # Get dataframe row-selections from user with st.data_editor
-        edited_df = st.sidebar.data_editor(
-            df_with_selections,
-            hide_index=True,  # Keep the index visible
-            column_config={"Select": st.column_config.CheckboxColumn(required=True)},
-            disabled=df.columns.tolist(),
-        )
+    Args:
+        node (ast.expr): The argument node.
 
-        # Filter the dataframe using the temporary column, then drop the column
-        selected_rows = edited_df[edited_df.Select]
-        selected_indices = (
-            selected_rows.index.tolist()
-        )  # Get the indices of the selected rows
-        return selected_indices
-
-    # Display the DataFrame in the sidebar
-    selected_indices = dataframe_with_selections(info)
-    # Get the names of the selected rows
-    selected_names = [cell_list[i].info["Name"] for i in selected_indices]
-    # Get the procedure names from the selected cells
-    procedure_names_sets = [
-        OrderedSet(cell_list[i].procedure.keys()) for i in selected_indices
-    ]
-
-    # Find the common procedure names
-    if len(procedure_names_sets) == 0:
-        procedure_names: List[str] = []
-    else:
-        procedure_names = list(procedure_names_sets[0])
-        for s in procedure_names_sets[1:]:
-            procedure_names = [x for x in procedure_names if x in s]
-    procedure_names = list(procedure_names)
-    selected_raw_data = st.sidebar.selectbox("Select a procedure", procedure_names)
-
-    # Select an experiment
-    if selected_raw_data is not None:
-        experiment_names = (
-            cell_list[selected_indices[0]].procedure[selected_raw_data].experiment_names
-        )
-        selected_experiment = st.sidebar.multiselect(
-            "Select an experiment", experiment_names
-        )
-        selected_experiment_tuple = tuple(selected_experiment)
+    Returns:
+        int | range: The value of the argument.
 
-    # Get the cycle and step numbers from the user
-    cycle_step_input = st.sidebar.text_input(
-        'Enter the cycle and step numbers (e.g., "cycle(1).step(2)")'
-    )
-    x_options = [
-        "Time [s]",
-        "Time [min]",
-        "Time [hr]",
-        "Capacity [Ah]",
-        "Capacity [mAh]",
-        "Capacity Throughput [Ah]",
-    ]
-    y_options = [
-        "Voltage [V]",
-        "Current [A]",
-        "Current [mA]",
-        "Capacity [Ah]",
-        "Capacity [mAh]",
-    ]
-
-    graph_placeholder = st.empty()
-
-    col1, col2, col3, col4 = st.columns(4)
-    # Create select boxes for the x and y axes
-    filter_stage = col1.selectbox(
-        "Filter stage", ["", "Experiment", "Cycle", "Step"], index=0
-    )
-    x_axis = col2.selectbox("x axis", x_options, index=0)
-    x_axis = f"{filter_stage} {x_axis}".strip()
-    y_axis = col3.selectbox("y axis", y_options, index=1)
-    secondary_y_axis = col4.selectbox("Secondary y axis", ["None"] + y_options, index=0)
-
-    # Select plot theme
-
-    themes = list(plotly.io.templates)
-    themes.remove("none")
-    themes.remove("streamlit")
-    themes.insert(0, "default")
-    plot_theme = "simple_white"
-
-    # Create a figure
-    fig = Plot()
-
-    selected_data = []
-    for i in range(len(selected_indices)):
-        selected_index = selected_indices[i]
-        if len(selected_experiment_tuple) == 0:
-            experiment_data = cell_list[selected_index].procedure[selected_raw_data]
-        else:
-            experiment_data = (
-                cell_list[selected_index]
-                .procedure[selected_raw_data]
-                .experiment(*selected_experiment_tuple)
-            )
-        # Check if the input is not empty
-        if cycle_step_input:
-            # Use eval to evaluate the input as Python code
-            filtered_data = eval(f"experiment_data.{cycle_step_input}")
-        else:
-            filtered_data = experiment_data
-
-        if secondary_y_axis == "None":
-            secondary_y_axis = None
+    Raises:
+        ValueError: If the argument is not an integer or a range of integers.
+    """
+    if isinstance(node, ast.Constant) and type(node.value) is int:
+        return node.value
+    if (
+        isinstance(node, ast.UnaryOp)
+        and isinstance(node.op, ast.USub)
+        and isinstance(node.operand, ast.Constant)
+        and type(node.operand.value) is int
+    ):
+        return -node.operand.value
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "range"
+        and not node.keywords
+    ):
+        range_arguments = [_parse_filter_argument(arg) for arg in node.args]
+        integer_arguments = [arg for arg in range_arguments if isinstance(arg, int)]
+        if len(integer_arguments) == len(range_arguments):
+            return range(*integer_arguments)
+    raise ValueError(f"Invalid filter argument: {ast.unparse(node)}")
+
+
+@lru_cache(maxsize=128)
+def _parse_filter(
+    cycle_step_input: str,
+) -> Tuple[Tuple[str, Tuple[int | range, ...]], ...]:
+    """Parse a filter string into a sequence of filter methods and their arguments.
 
-        fig = fig.add_line(filtered_data, x_axis, y_axis, secondary_y=secondary_y_axis)
-        filtered_data = filtered_data.data.to_pandas()
-        selected_data.append(filtered_data)
+    Args:
+        cycle_step_input (str): The filter string, e.g. "cycle(1).step(2)".
 
-    # Show the plot
-    if len(selected_data) > 0 and len(procedure_names) > 0:
-        graph_placeholder.plotly_chart(
-            fig.fig, theme="streamlit" if plot_theme == "default" else None
-        )
+    Returns:
+        Tuple[Tuple[str, Tuple[int | range, ...]], ...]:
+            The name and arguments of each filter method, in the order they are
+            applied. E.g. (("cycle", (1,)), ("step", (2,))).
 
-    # Show raw data in tabs
-    if selected_data:
-        tabs = st.tabs(selected_names)
-        columns = [
-            "Time [s]",
-            "Step",
-            "Current [A]",
-            "Voltage [V]",
-            "Capacity [Ah]",
-        ]
-        for tab in tabs:
-            tab.dataframe(selected_data[tabs.index(tab)][columns], hide_index=True)
+    Raises:
+        ValueError: If the string is not a chain of filter method calls.
+    """
+    try:
+        node = ast.parse(cycle_step_input.strip(), mode="eval").body
+    except SyntaxError:
+        raise ValueError(f"Invalid filter: {cycle_step_input}")
+    filters = []
+    while True:
+        if not isinstance(node, ast.Call) or node.keywords:
+            raise ValueError(f"Invalid filter: {cycle_step_input}")
+        arguments = tuple(_parse_filter_argument(arg) for arg in node.args)
+        if isinstance(node.func, ast.Name):
+            filters.append((node.func.id, arguments))
+            break
+        elif isinstance(node.func, ast.Attribute):
+            filters.append((node.func.attr, arguments))
+            node = node.func.value
+        else:
+            raise ValueError(f"Invalid filter: {cycle_step_input}")
+    if any(name.startswith("_") for name, _ in filters):
+        raise ValueError(f"Invalid filter: {cycle_step_input}")
+    return tuple(reversed(filters))
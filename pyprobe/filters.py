@@ -14,6 +14,30 @@ if TYPE_CHECKING:
         FilterToCycleType,
     )
 
+# The step conditions do not depend on the data, so they are only built once
+_CHARGE_CONDITION = pl.col("Current [A]") > 0
+_DISCHARGE_CONDITION = pl.col("Current [A]") < 0
+_CHARGEORDISCHARGE_CONDITION = pl.col("Current [A]") != 0
+_REST_CONDITION = pl.col("Current [A]") == 0
+_CONSTANT_CURRENT_CONDITION = (
+    (pl.col("Current [A]") != 0)
+    & (
+        pl.col("Current [A]").abs()
+        > 0.999 * pl.col("Current [A]").abs().round_sig_figs(4).mode()
+    )
+    & (
+        pl.col("Current [A]").abs()
+        < 1.001 * pl.col("Current [A]").abs().round_sig_figs(4).mode()
+    )
+)
+_CONSTANT_VOLTAGE_CONDITION = (
+    pl.col("Voltage [V]").abs()
+    > 0.999 * pl.col("Voltage [V]").abs().round_sig_figs(4).mode()
+) & (
+    pl.col("Voltage [V]").abs()
+    < 1.001 * pl.col("Voltage [V]").abs().round_sig_figs(4).mode()
+)
+
 
 def _filter_numerical(
     dataframe: pl.LazyFrame | pl.DataFrame,
@@ -116,7 +140,7 @@ def get_cycle_column(filter: "FilterToCycleType") -> pl.DataFrame | pl.LazyFrame
             "numbers."
         )
         cycle_column = (
-            (pl.col("Step").cast(pl.Int64) - pl.col("Step").cast(pl.Int64).shift() < 0)
+            (pl.col("Step").cast(pl.Int64).diff() < 0)
             .fill_null(strategy="zero")
             .cum_sum()
             .alias("Cycle")
@@ -164,8 +188,7 @@ def _charge(filter: "FilterToCycleType", *charge_numbers: Union[int, range]) ->
     Returns:
         Step: A charge step object.
     """
-    condition = pl.col("Current [A]") > 0
-    return filter.step(*charge_numbers, condition=condition)
+    return filter.step(*charge_numbers, condition=_CHARGE_CONDITION)
 
 
 def _discharge(
@@ -182,8 +205,7 @@ def _discharge(
     Returns:
         Step: A discharge step object.
     """
-    condition = pl.col("Current [A]") < 0
-    return filter.step(*discharge_numbers, condition=condition)
+    return filter.step(*discharge_numbers, condition=_DISCHARGE_CONDITION)
 
 
 def _chargeordischarge(
@@ -201,8 +223,9 @@ def _chargeordischarge(
     Returns:
         Step: A charge or discharge step object.
     """
-    condition = pl.col("Current [A]") != 0
-    return filter.step(*chargeordischarge_numbers, condition=condition)
+    return filter.step(
+        *chargeordischarge_numbers, condition=_CHARGEORDISCHARGE_CONDITION
+    )
 
 
 def _rest(filter: "FilterToCycleType", *rest_numbers: Union[int, range]) -> "Step":
@@ -216,8 +239,7 @@ def _rest(filter: "FilterToCycleType", *rest_numbers: Union[int, range]) -> "Ste
     Returns:
         Step: A rest step object.
     """
-    condition = pl.col("Current [A]") == 0
-    return filter.step(*rest_numbers, condition=condition)
+    return filter.step(*rest_numbers, condition=_REST_CONDITION)
 
 
 def _constant_current(
@@ -234,18 +256,7 @@ def _constant_current(
     Returns:
         Step: A constant current step object.
     """
-    condition = (
-        (pl.col("Current [A]") != 0)
-        & (
-            pl.col("Current [A]").abs()
-            > 0.999 * pl.col("Current [A]").abs().round_sig_figs(4).mode()
-        )
-        & (
-            pl.col("Current [A]").abs()
-            < 1.001 * pl.col("Current [A]").abs().round_sig_figs(4).mode()
-        )
-    )
-    return filter.step(*constant_current_numbers, condition=condition)
+    return filter.step(*constant_current_numbers, condition=_CONSTANT_CURRENT_CONDITION)
 
 
 def _constant_voltage(
@@ -262,14 +273,7 @@ def _constant_voltage(
     Returns:
         Step: A constant voltage step object.
     """
-    condition = (
-        pl.col("Voltage [V]").abs()
-        > 0.999 * pl.col("Voltage [V]").abs().round_sig_figs(4).mode()
-    ) & (
-        pl.col("Voltage [V]").abs()
-        < 1.001 * pl.col("Voltage [V]").abs().round_sig_figs(4).mode()
-    )
-    return filter.step(*constant_voltage_numbers, condition=condition)
+    return filter.step(*constant_voltage_numbers, condition=_CONSTANT_VOLTAGE_CONDITION)
 
 
 class Procedure(RawData):
@@ -330,10 +334,13 @@ class Procedure(RawData):
         """
         steps_idx = []
         for experiment_name in experiment_names:
-            if experiment_name not in self.experiment_names:
+            if experiment_name not in self.readme_dict:
                 raise ValueError(f"{experiment_name} not in procedure.")
             steps_idx.append(self.readme_dict[experiment_name]["Steps"])
-        flattened_steps = utils.flatten_list(steps_idx)
+        # pass the steps as a typed series, so polars does not infer it from a list
+        flattened_steps = pl.Series(
+            "Step", utils.flatten_list(steps_idx), dtype=pl.Int64
+        )
         conditions = [
             pl.col("Step").is_in(flattened_steps),
         ]
@@ -368,10 +375,13 @@ class Procedure(RawData):
         """
         steps_idx = []
         for experiment_name in experiment_names:
-            if experiment_name not in self.experiment_names:
+            if experiment_name not in self.readme_dict:
                 raise ValueError(f"{experiment_name} not in procedure.")
             steps_idx.append(self.readme_dict[experiment_name]["Steps"])
-        flattened_steps = utils.flatten_list(steps_idx)
+        # pass the steps as a typed series, so polars does not infer it from a list
+        flattened_steps = pl.Series(
+            "Step", utils.flatten_list(steps_idx), dtype=pl.Int64
+        )
         conditions = [
             pl.col("Step").is_in(flattened_steps).not_(),
         ]
@@ -34,6 +34,11 @@ class Plot:
         width=800,
         height=600,
     )
+    webgl_threshold = 10000
+    """Lines with more points than this are drawn with WebGL rather than SVG.
+
+    Browsers limit the number of WebGL contexts on a page, so WebGL is only used where
+    SVG rendering would be slow."""
 
     def __init__(
         self,
@@ -97,26 +102,44 @@ class Plot:
             else:
                 label = "Data"
 
-        self._check_limits(result.get_only(x), result.get_only(y))
+        x_data = result.get_only(x)
+        y_data = result.get_only(y)
+        self._check_limits(x_data, y_data)
         self.xaxis_title = x
         self.yaxis_title = y
 
         self._fig.add_trace(
-            go.Scatter(
-                x=result.get_only(x),
-                y=result.get_only(y),
+            self._scatter_type(len(x_data))(
+                x=x_data,
+                y=y_data,
                 mode="lines",
                 line=dict(color=color, dash=dash),
                 name=label,
+                legendgroup=label,
                 showlegend=showlegend,
             )
         )
 
         if secondary_y is not None:
             self.secondary_y = secondary_y
-            self._add_secondary_y_line(result, x, secondary_y)
+            self._add_secondary_y_line(
+                result, x, secondary_y, color=color, label=label, x_data=x_data
+            )
         return self
 
+    def _scatter_type(self, n_points: int) -> type[go.Scatter] | type[go.Scattergl]:
+        """Return the trace type to draw a line with.
+
+        Args:
+            n_points (int): The number of points in the line.
+
+        Returns:
+            type[go.Scatter] | type[go.Scattergl]:
+                go.Scattergl if the line has more points than
+                :attr:`webgl_threshold`, otherwise go.Scatter.
+        """
+        return go.Scattergl if n_points > self.webgl_threshold else go.Scatter
+
     def _add_secondary_y_line(
         self,
         result: "Result",
@@ -124,6 +147,7 @@ class Plot:
         y: str,
         color: Optional[str] = None,
         label: Optional[str] = None,
+        x_data: Optional[NDArray[np.float64]] = None,
     ) -> "Plot":
         """Add a secondary y-axis to the plot.
 
@@ -133,21 +157,27 @@ class Plot:
             y (str): The secondary y-axis column.
             color (str): The color of the line.
             label (str): The label of the line.
+            x_data (NDArray[np.float64]):
+                The x-axis data, if it has already been retrieved from the result.
         """
         if color is None:
             color = str(result.info["color"])
         if label is None:
             label = str(result.info["Name"])
 
-        self._check_limits(result.get_only(x), result.get_only(y))
+        if x_data is None:
+            x_data = result.get_only(x)
+        y_data = result.get_only(y)
+        self._check_limits(x_data, y_data, secondary_y=True)
 
         self._fig.add_trace(
-            go.Scatter(
-                x=result.get_only(x),
-                y=result.get_only(y),
+            self._scatter_type(len(x_data))(
+                x=x_data,
+                y=y_data,
                 mode="lines",
                 line=dict(color=color, dash="dash"),
                 name=label,
+                legendgroup=label,
                 yaxis="y2",
                 showlegend=False,
             ),
@@ -159,9 +189,13 @@ class Plot:
     def _add_secondary_y_legend(self, secondary_y_axis: str) -> None:
         """Add a legend for the secondary y-axis.
 
+        The legend entry is only added once, however many times it is requested.
+
         Args:
             secondary_y_axis (str): The label for the secondary y-axis.
         """
+        if any(trace.legendgroup == "_secondary_y" for trace in self._fig.data):
+            return
         self._fig.add_trace(
             go.Scatter(
                 x=[None],
@@ -169,6 +203,7 @@ class Plot:
                 mode="lines",
                 line=dict(color="black", dash="dash"),
                 name=secondary_y_axis,
+                legendgroup="_secondary_y",
                 showlegend=True,
             )
         )
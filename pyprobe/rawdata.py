@@ -66,8 +66,8 @@ class RawData(Result):
         cls, dataframe: pl.LazyFrame | pl.DataFrame
     ) -> "RawData":
         """Check if the required columns are present in the input_data."""
-        column_list = dataframe.collect_schema().names()
-        missing_columns = [col for col in required_columns if col not in column_list]
+        column_set = set(dataframe.collect_schema().names())
+        missing_columns = [col for col in required_columns if col not in column_set]
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
         return dataframe
@@ -98,10 +98,21 @@ class RawData(Result):
     def capacity(self) -> float:
         """Calculate the net capacity passed.
 
+        The value is cached, and only recalculated if the data of this object has been
+        replaced since the last call.
+
         Returns:
             float: The net capacity passed.
         """
-        return abs(self.data["Capacity [Ah]"].max() - self.data["Capacity [Ah]"].min())
+        if "capacity" not in self._get_cache():
+            capacity = pl.col("Capacity [Ah]")
+            net_capacity = self.data.select(
+                (capacity.max() - capacity.min()).abs()
+            ).item()
+            # accessing the data may replace a LazyFrame with the collected DataFrame,
+            # so the cache is retrieved again to store the value
+            self._get_cache()["capacity"] = net_capacity
+        return self._get_cache()["capacity"]
 
     def set_SOC(
         self,
@@ -141,17 +152,16 @@ class RawData(Result):
             )
         else:
             if self.contains_lazyframe:
-                reference_charge_data = reference_charge.base_dataframe.select(
-                    "Time [s]", "Capacity [Ah]"
+                # reduce the reference charge to its maximum capacity within the query,
+                # so that only a single row is joined onto this data
+                reference_charge_data = reference_charge.base_dataframe.lazy().select(
+                    pl.col("Capacity [Ah]")
+                    .max()
+                    .alias("Full charge reference capacity")
                 )
                 self.base_dataframe = self.base_dataframe.join(
-                    reference_charge_data, on="Time [s]", how="left"
+                    reference_charge_data, how="cross"
                 )
-                self.base_dataframe = self.base_dataframe.with_columns(
-                    pl.col("Capacity [Ah]_right")
-                    .max()
-                    .alias("Full charge reference capacity"),
-                ).drop("Capacity [Ah]_right")
             else:
                 full_charge_reference_capacity = (
                     reference_charge.data.select("Capacity [Ah]").max().item()
@@ -1,9 +1,16 @@
 """Module for processing PyPrBE README files."""
+import copy
+import os
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple, Union, cast
 
 import yaml
 
-from pyprobe import utils
+try:
+    # use the libyaml parser when available, as it is much faster
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
 
 
 class ReadmeModel:
@@ -18,6 +25,7 @@ class ReadmeModel:
             str, Dict[str, List[str | int | Tuple[int, int, int]]]
         ] = {name: {} for name in experiment_names}
         self.step_details = None
+        self._max_step = 0
         for experiment_name in experiment_names:
             if "Steps" in self.readme_dict[experiment_name].keys():
                 if isinstance(self.readme_dict[experiment_name]["Steps"], dict):
@@ -32,6 +40,9 @@ class ReadmeModel:
                 raise ValueError(
                     "Each experiment must have a 'Steps' or 'Total Steps' key."
                 )
+            step_numbers = self.experiment_dict[experiment_name]["Steps"]
+            if step_numbers:
+                self._max_step = max(self._max_step, *cast(List[int], step_numbers))
 
     def _process_explicit_experiment(self, experiment_name: str) -> None:
         """Process an experiment with explicit step numbers.
@@ -88,15 +99,13 @@ class ReadmeModel:
     def _get_max_step(self) -> int:
         """Get the maximum step number from the experiment dictionary.
 
+        The maximum is updated as each experiment is processed, rather than searching
+        the steps of every previous experiment.
+
         Returns:
             int: The maximum step number from previously processed experiments.
         """
-        all_steps = [
-            experiment["Steps"]
-            for experiment in self.experiment_dict.values()
-            if "Steps" in experiment
-        ]
-        return max(utils.flatten_list(all_steps)) if all_steps else 0
+        return self._max_step
 
 
 def process_readme(
@@ -113,6 +122,25 @@ def process_readme(
             - List[List[int]]: The list of steps from the README.yaml file.
             - Optional[pybamm.Experiment]: The PyBaMM experiment object.
     """
+    readme_dict = _load_readme(
+        os.path.abspath(readme_path), os.stat(readme_path).st_mtime_ns
+    )
+    # copy the cached dictionary, so that it cannot be modified through the model
+    return ReadmeModel(readme_dict=copy.deepcopy(readme_dict))
+
+
+@lru_cache(maxsize=32)
+def _load_readme(readme_path: str, modified_time: int) -> Dict[str, Any]:
+    """Parse a README.yaml file, caching the result until the file is modified.
+
+    Args:
+        readme_path (str): The absolute path to the README.yaml file.
+        modified_time (int):
+            The modification time of the file in nanoseconds. Only used as part of
+            the cache key, so that a file is parsed again if it has been overwritten.
+
+    Returns:
+        Dict[str, Any]: The contents of the README.yaml file.
+    """
     with open(readme_path, "r") as file:
-        readme_dict = yaml.safe_load(file)
-    return ReadmeModel(readme_dict=readme_dict)
+        return yaml.load(file, Loader=SafeLoader)
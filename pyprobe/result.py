@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 import numpy as np
 import polars as pl
 from numpy.typing import NDArray
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from pyprobe.units import unit_from_regexp
 
@@ -40,6 +40,11 @@ class Result(BaseModel):
     column_definitions: Dict[str, str] = Field(default_factory=dict)
     """A dictionary containing the definitions of the columns in the data."""
 
+    _cache: Dict[Any, Any] = PrivateAttr(default_factory=dict)
+    _cache_dataframe: Optional[Union[pl.LazyFrame, pl.DataFrame]] = PrivateAttr(
+        default=None
+    )
+
     @model_validator(mode="before")
     @classmethod
     def _load_base_dataframe(cls, data: Any) -> Any:
@@ -67,11 +72,7 @@ class Result(BaseModel):
             stacklevel=2,
         )
 
-        self._check_units(column_name)
-        if column_name not in self.data.collect_schema().names():
-            raise ValueError(f"Column '{column_name}' not in data.")
-        else:
-            return self.data[column_name].to_numpy()
+        return self._get_filtered_array((column_name,))[:, 0]
 
     def __getitem__(self, *column_name: str) -> "Result":
         """Return a new result object with the specified columns.
@@ -85,10 +86,7 @@ class Result(BaseModel):
         column_names = list(column_name)
         for col in column_names:
             self._check_units(col)
-        if not all(col in self.data.collect_schema().names() for col in column_names):
-            raise ValueError("One or more columns not in data.")
-        else:
-            return Result(base_dataframe=self.data.select(column_names), info=self.info)
+        return Result(base_dataframe=self.data.select(column_names), info=self.info)
 
     @property
     def data(self) -> pl.DataFrame:
@@ -181,6 +179,11 @@ class Result(BaseModel):
     ) -> NDArray[np.float64]:
         """Return the data as a single numpy array from a list of column names.
 
+        Columns of a DataFrame are converted directly, so that a single numeric column
+        is returned as a zero-copy view of the data. When the data is a LazyFrame, the
+        collected columns are cached by column names, so that repeated requests for the
+        same columns do not collect the query again.
+
         Args:
             filtering_column_names (Tuple[str, ...]): The column names to return.
 
@@ -192,17 +195,21 @@ class Result(BaseModel):
         """
         for column_name in filtering_column_names:
             self._check_units(column_name)
-            if column_name not in self.base_dataframe.collect_schema().names():
-                raise ValueError(f"Column '{column_name}' not in data.")
-        frame_to_return = self.base_dataframe.select(filtering_column_names)
-        if isinstance(frame_to_return, pl.LazyFrame):
-            frame_to_return = frame_to_return.collect()
-        return frame_to_return.to_numpy()
+        if isinstance(self.base_dataframe, pl.DataFrame):
+            return self.base_dataframe.select(filtering_column_names).to_numpy()
+        cache = self._get_cache()
+        cache_key = ("frame", filtering_column_names)
+        if cache_key not in cache:
+            cache[cache_key] = self.base_dataframe.select(
+                filtering_column_names
+            ).collect()
+        return cache[cache_key].to_numpy()
 
     def _check_units(self, column_name: str) -> None:
         """Check if a column exists and convert the units if it does not.
 
-        Adds a new column to the dataframe with the desired unit.
+        Adds a new column to the dataframe with the desired unit. After this method
+        returns without error, the column is guaranteed to be in the data.
 
         Args:
             column_name (str): The column name to convert to.
@@ -210,7 +217,7 @@ class Result(BaseModel):
         Raises:
             ValueError: If the column name is not in the data.
         """
-        if column_name not in self.base_dataframe.collect_schema().names():
+        if column_name not in self.column_list:
             converter_object = unit_from_regexp(column_name)
             if converter_object.input_quantity in self.quantities:
                 instruction = converter_object.from_default_unit()
@@ -227,6 +234,8 @@ class Result(BaseModel):
                     f"Column with quantity'{converter_object.input_quantity}' not in"
                     " data."
                 )
+            if column_name not in self.column_list:
+                raise ValueError(f"Column '{column_name}' not in data.")
 
     @property
     def quantities(self) -> List[str]:
@@ -248,10 +257,31 @@ class Result(BaseModel):
     def column_list(self) -> List[str]:
         """The columns in the data.
 
+        Resolving the schema of a LazyFrame requires resolving its whole query plan, so
+        the column names are cached, and only resolved again if the data of this object
+        has been replaced since the last call.
+
         Returns:
             List[str]: The columns in the data.
         """
-        return self.base_dataframe.collect_schema().names()
+        cache = self._get_cache()
+        if "column_list" not in cache:
+            cache["column_list"] = self.base_dataframe.collect_schema().names()
+        return list(cache["column_list"])
+
+    def _get_cache(self) -> Dict[Any, Any]:
+        """Return the cache of values calculated from the data.
+
+        The cache is emptied if the data of this object has been replaced since the
+        cache was last accessed.
+
+        Returns:
+            Dict[Any, Any]: The cached values.
+        """
+        if self._cache_dataframe is not self.base_dataframe:
+            self._cache = {}
+            self._cache_dataframe = self.base_dataframe
+        return self._cache
 
     def define_column(self, column_name: str, definition: str) -> None:
         """Define a new column when it is added to the dataframe.
@@ -353,10 +383,7 @@ class Result(BaseModel):
             self.base_dataframe, [new_data], mode="match 1"
         )
         new_data = new_data[0]
-        if (
-            new_data.dtypes[new_data.collect_schema().names().index(date_column_name)]
-            != pl.Datetime
-        ):
+        if new_data.collect_schema()[date_column_name] != pl.Datetime:
             new_data = new_data.with_columns(pl.col(date_column_name).str.to_datetime())
 
         # Ensure both DataFrames have DateTime columns in the same unit
@@ -1,10 +1,13 @@
 """A module for unit conversion of PyProBE data."""
 
 import re
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 
 import polars as pl
 
+_non_alphabetic_characters = re.compile(r"[^a-zA-Z]")
+
 
 class Units:
     """A class to store unit conversion information about columns.
@@ -64,7 +67,7 @@ class Units:
         Returns:
             Tuple[Optional[str], str]: The prefix and default unit.
         """
-        unit = re.sub(r"[^a-zA-Z]", "", unit)  # Remove non-alphabetic characters
+        unit = _non_alphabetic_characters.sub("", unit)  # Remove non-alphabetic chars
         if unit in self.time_unit_dict.keys():
             return None, "s"
         if unit[0] in self.prefix_dict:
@@ -105,6 +108,19 @@ class Units:
         ).alias(f"{self.input_quantity} [{self.default_unit}]")
 
 
+@lru_cache(maxsize=None)
+def _compile_pattern(regular_expression: str) -> re.Pattern[str]:
+    """Compile a regular expression, caching the compiled pattern.
+
+    Args:
+        regular_expression (str): The regular expression to compile.
+
+    Returns:
+        re.Pattern[str]: The compiled pattern.
+    """
+    return re.compile(regular_expression)
+
+
 def unit_from_regexp(
     name: str, regular_expression: str = r"([\w\s]+?)\s*\[(\w+)\]"
 ) -> "Units":
@@ -114,8 +130,7 @@ def unit_from_regexp(
         name (str): The column name.
         regular_expression (str): The pattern to match the column name.
     """
-    pattern = re.compile(regular_expression)
-    match = pattern.match(name)
+    match = _compile_pattern(regular_expression).match(name)
     if match is not None:
         return Units(match.group(1), match.group(2))
     else:
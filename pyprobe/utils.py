@@ -1,10 +1,14 @@
 """A collection of utility functions for PyProBE."""
+from itertools import chain
 from typing import Any, List
 
 
 def flatten_list(lst: int | List[Any]) -> List[int]:
     """Flatten a list of lists into a single list.
 
+    Lists that are already flat, or nested a single level deep, are flattened without
+    recursion.
+
     Args:
         lst (list): The list of lists to flatten.
 
@@ -13,5 +17,11 @@ def flatten_list(lst: int | List[Any]) -> List[int]:
     """
     if not isinstance(lst, list):
         return [lst]
-    else:
-        return [item for sublist in lst for item in flatten_list(sublist)]
+    if not any(isinstance(item, list) for item in lst):
+        return list(lst)
+    if all(
+        isinstance(item, list) and not any(isinstance(sub, list) for sub in item)
+        for item in lst
+    ):
+        return list(chain.from_iterable(lst))
+    return [item for sublist in lst for item in flatten_list(sublist)]
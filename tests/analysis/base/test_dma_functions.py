@@ -42,6 +42,18 @@ def test_calc_electrode_capacities():
     assert math.isclose(ne_capacity, 100 / 0.6)
     assert math.isclose(li_inventory, 875 / 6)
 
+    # test with arrays of stoichiometry limits
+    pe_capacity, ne_capacity, li_inventory = dma_functions.calc_electrode_capacities(
+        np.array([0.9, 0.8]),
+        np.array([0.1, 0.1]),
+        np.array([0.2, 0.2]),
+        np.array([0.8, 0.8]),
+        np.array([100.0, 70.0]),
+    )
+    np.testing.assert_allclose(pe_capacity, [125.0, 100.0])
+    np.testing.assert_allclose(ne_capacity, [100 / 0.6, 70 / 0.6])
+    np.testing.assert_allclose(li_inventory, [875 / 6, 80 + 70 / 3])
+
 
 def test_calculate_dma_parameters():
     """Test the calculate_dma_parameters function."""
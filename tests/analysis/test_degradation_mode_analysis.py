@@ -5,6 +5,7 @@ import numpy as np
 import polars as pl
 import pytest
 import sympy as sp
+from scipy import optimize
 from scipy.interpolate import PPoly
 
 import pyprobe.analysis.base.degradation_mode_analysis_functions as dma_functions
@@ -227,6 +228,24 @@ def test_f_grad_OCV(ne_ocp_fixture, pe_ocp_fixture):
     np.testing.assert_allclose(d_ocv, numerical_d_ocv)
 
 
+def test_build_objective_gradient():
+    """Test the analytic gradient of the OCV objective function."""
+    sto = sp.Symbol("x")
+    ocp_pe = OCP.from_expression(4.2 - 0.5 * sto - 0.1 * sp.tanh(10 * (sto - 0.5)))
+    ocp_ne = OCP.from_expression(0.1 + 0.2 * sp.exp(-10 * sto))
+    soc = np.linspace(0, 1, 1000)
+    ocv_target = dma._f_OCV(ocp_pe, ocp_ne, soc, 0.8, 0.1, 0.1, 0.7)
+    objective_function = dma._build_objective_function(
+        ocp_pe, ocp_ne, soc, ocv_target, "OCV", False, False
+    )
+    objective_gradient = dma._build_objective_gradient(ocp_pe, ocp_ne, soc, ocv_target)
+    params = np.array([0.75, 0.15, 0.12, 0.65])
+    numerical_gradient = optimize.approx_fprime(params, objective_function, 1e-7)
+    np.testing.assert_allclose(
+        objective_gradient(params), numerical_gradient, rtol=1e-3
+    )
+
+
 def test_run_ocv_curve_fit(ne_ocp_fixture, pe_ocp_fixture):
     """Test the run_ocv_curve_fit method."""
     x_pe_lo = 0.8
@@ -272,10 +291,10 @@ def test_run_ocv_curve_fit(ne_ocp_fixture, pe_ocp_fixture):
         "Anode Capacity [Ah]",
         "Li Inventory [Ah]",
     ]
-    np.testing.assert_allclose(limits.data["x_pe low SOC"].to_numpy()[0], x_pe_lo)
-    np.testing.assert_allclose(limits.data["x_pe high SOC"].to_numpy()[0], x_pe_hi)
-    np.testing.assert_allclose(limits.data["x_ne low SOC"].to_numpy()[0], x_ne_lo)
-    np.testing.assert_allclose(limits.data["x_ne high SOC"].to_numpy()[0], x_ne_hi)
+    np.testing.assert_allclose(limits.data.item(0, "x_pe low SOC"), x_pe_lo)
+    np.testing.assert_allclose(limits.data.item(0, "x_pe high SOC"), x_pe_hi)
+    np.testing.assert_allclose(limits.data.item(0, "x_ne low SOC"), x_ne_lo)
+    np.testing.assert_allclose(limits.data.item(0, "x_ne high SOC"), x_ne_hi)
 
     np.testing.assert_allclose(fit.data["Fitted Voltage [V]"].to_numpy(), ocv_target)
     np.testing.assert_allclose(
@@ -340,18 +359,10 @@ def test_run_ocv_curve_fit_dQdV(ne_ocp_fixture, pe_ocp_fixture):
         "Anode Capacity [Ah]",
         "Li Inventory [Ah]",
     ]
-    np.testing.assert_allclose(
-        limits.data["x_pe low SOC"].to_numpy()[0], x_pe_lo, rtol=1e-5
-    )
-    np.testing.assert_allclose(
-        limits.data["x_pe high SOC"].to_numpy()[0], x_pe_hi, rtol=1e-5
-    )
-    np.testing.assert_allclose(
-        limits.data["x_ne low SOC"].to_numpy()[0], x_ne_lo, rtol=1e-5
-    )
-    np.testing.assert_allclose(
-        limits.data["x_ne high SOC"].to_numpy()[0], x_ne_hi, rtol=1e-5
-    )
+    np.testing.assert_allclose(limits.data.item(0, "x_pe low SOC"), x_pe_lo, rtol=1e-5)
+    np.testing.assert_allclose(limits.data.item(0, "x_pe high SOC"), x_pe_hi, rtol=1e-5)
+    np.testing.assert_allclose(limits.data.item(0, "x_ne low SOC"), x_ne_lo, rtol=1e-5)
+    np.testing.assert_allclose(limits.data.item(0, "x_ne high SOC"), x_ne_hi, rtol=1e-5)
 
     np.testing.assert_allclose(
         fit.data["Fitted Voltage [V]"].to_numpy(), ocv_target, rtol=1e-6
@@ -407,10 +418,10 @@ def test_run_ocv_curve_fit_dVdQ(ne_ocp_fixture, pe_ocp_fixture):
         "Anode Capacity [Ah]",
         "Li Inventory [Ah]",
     ]
-    np.testing.assert_allclose(limits.data["x_pe low SOC"].to_numpy()[0], x_pe_lo)
-    np.testing.assert_allclose(limits.data["x_pe high SOC"].to_numpy()[0], x_pe_hi)
-    np.testing.assert_allclose(limits.data["x_ne low SOC"].to_numpy()[0], x_ne_lo)
-    np.testing.assert_allclose(limits.data["x_ne high SOC"].to_numpy()[0], x_ne_hi)
+    np.testing.assert_allclose(limits.data.item(0, "x_pe low SOC"), x_pe_lo)
+    np.testing.assert_allclose(limits.data.item(0, "x_pe high SOC"), x_pe_hi)
+    np.testing.assert_allclose(limits.data.item(0, "x_ne low SOC"), x_ne_lo)
+    np.testing.assert_allclose(limits.data.item(0, "x_ne high SOC"), x_ne_hi)
 
     np.testing.assert_allclose(fit.data["Fitted Voltage [V]"].to_numpy(), ocv_target)
     np.testing.assert_allclose(
@@ -566,7 +577,7 @@ def bol_stoich_fixture(
 ):
     """Return a Result instance."""
     stoichiometry_limits = Result(
-        base_dataframe=pl.LazyFrame(
+        base_dataframe=pl.DataFrame(
             {
                 "x_pe low SOC": bol_pe_limits_fixture[0],
                 "x_pe high SOC": bol_pe_limits_fixture[1],
@@ -589,7 +600,7 @@ def eol_stoich_fixture(
 ):
     """Return a Result instance."""
     stoichiometry_limits = Result(
-        base_dataframe=pl.LazyFrame(
+        base_dataframe=pl.DataFrame(
             {
                 "x_pe low SOC": eol_pe_limits_fixture[0],
                 "x_pe high SOC": eol_pe_limits_fixture[1],
@@ -619,10 +630,10 @@ def test_quantify_degradation_modes(
 
     result = dma.quantify_degradation_modes([bol_stoich_fixture, eol_stoich_fixture])
     # Test assertions using numpy's assert_allclose
-    np.testing.assert_allclose(result.data["SOH"].to_numpy()[1], expected_SOH)
-    np.testing.assert_allclose(result.data["LAM_pe"].to_numpy()[1], expected_LAM_pe)
-    np.testing.assert_allclose(result.data["LAM_ne"].to_numpy()[1], expected_LAM_ne)
-    np.testing.assert_allclose(result.data["LLI"].to_numpy()[1], expected_LLI)
+    np.testing.assert_allclose(result.data.item(1, "SOH"), expected_SOH)
+    np.testing.assert_allclose(result.data.item(1, "LAM_pe"), expected_LAM_pe)
+    np.testing.assert_allclose(result.data.item(1, "LAM_ne"), expected_LAM_ne)
+    np.testing.assert_allclose(result.data.item(1, "LLI"), expected_LLI)
     np.testing.assert_allclose(result.data["Index"].to_numpy(), [0, 1])
     assert result.data.columns == [
         "Index",
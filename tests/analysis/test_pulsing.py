@@ -50,6 +50,16 @@ def test_get_resistances(Pulsing_fixture):
     assert resistances.get("R0 [Ohms]")[0] == (4.1558 - 4.1919) / -0.0199936
     assert resistances.get("R_10s [Ohms]")[0] == (4.1337 - 4.1919) / -0.0199936
 
+    # voltages between data points are interpolated linearly in time
+    resistances = pulsing.get_resistances(Pulsing_fixture, [10.05, 1e9])
+    assert np.isclose(
+        resistances.get("R_10.05s [Ohms]")[0], (4.13365 - 4.1919) / -0.0199936
+    )
+    # times after the end of the data give null values
+    assert resistances.data["R_1000000000.0s [Ohms]"].null_count() == len(
+        resistances.data
+    )
+
 
 def test_get_ocv_curve(Pulsing_fixture):
     """Test the get_ocv_curve method."""
@@ -28,6 +28,18 @@ def test_assemble_array(input_data_fixture):
     """Test the assemble array method."""
     array = utils.assemble_array([input_data_fixture, input_data_fixture], "x")
     assert np.array_equal(array, np.array([[1, 2, 3], [1, 2, 3]]))
+    assert array.dtype == np.int64
+
+    float_result = input_data_fixture.clean_copy(pl.DataFrame({"x": [1.5, 2.0, 3.0]}))
+    array = utils.assemble_array([input_data_fixture, float_result], "x")
+    np.testing.assert_array_equal(array, np.array([[1, 2, 3], [1.5, 2.0, 3.0]]))
+
+    with pytest.raises(ValueError):
+        utils.assemble_array([], "x")
+
+    short_result = input_data_fixture.clean_copy(pl.DataFrame({"x": [1, 2]}))
+    with pytest.raises(ValueError):
+        utils.assemble_array([input_data_fixture, short_result], "x")
 
 
 def test_base_analysis(input_data_fixture):
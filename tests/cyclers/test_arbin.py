@@ -24,7 +24,8 @@ def test_read_and_process_arbin(benchmark):
             "Voltage [V]": [3.599601],
             "Capacity [Ah]": [0.0007812400999999999],
             "Temperature [C]": [24.68785],
-        }
+        },
+        schema_overrides={"Event": pl.UInt32},
     )
     expected_events = set([0, 1, 2])
     helper_read_and_process(
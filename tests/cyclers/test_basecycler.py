@@ -9,7 +9,7 @@ import polars.testing as pl_testing
 import pytest
 from polars.testing import assert_frame_equal
 
-from pyprobe.cyclers.basecycler import BaseCycler
+from pyprobe.cyclers.basecycler import BaseCycler, _read_excel
 
 
 @pytest.fixture
@@ -49,7 +49,8 @@ def sample_pyprobe_dataframe():
             "Voltage [V]": [4.0, 5.0, 6.0],
             "Capacity [Ah]": [10.0, 11.0, 12.0],
             "Temperature [C]": [13.0, 14.0, 15.0],
-        }
+        },
+        schema_overrides={"Event": pl.UInt32},
     ).with_columns(pl.col("Date").str.to_datetime())
 
 
@@ -293,6 +294,16 @@ def test_pyprobe_dataframe(sample_cycler_instance, sample_pyprobe_dataframe):
     pl_testing.assert_frame_equal(
         sample_cycler_instance.pyprobe_dataframe.collect(), sample_pyprobe_dataframe
     )
+    # the conversion expressions are only built once
+    expressions = sample_cycler_instance._get_pyprobe_expressions()
+    assert sample_cycler_instance._get_pyprobe_expressions() is expressions
+    # importing the data again rebuilds the expressions from the new column map
+    sample_cycler_instance.import_and_validate_data()
+    assert sample_cycler_instance._pyprobe_expressions is None
+    assert sample_cycler_instance._get_pyprobe_expressions() is not expressions
+    pl_testing.assert_frame_equal(
+        sample_cycler_instance.pyprobe_dataframe.collect(), sample_pyprobe_dataframe
+    )
     os.remove("tests/sample_data/test_data.csv")
 
 
@@ -318,6 +329,32 @@ def test_multiple_files(sample_dataframe, column_dict):
     os.remove("tests/sample_data/test_data_2.csv")
 
 
+def test_read_excel_cached(sample_dataframe):
+    """Test that Excel files are only re-read once they have been modified."""
+    filepath = "tests/sample_data/test_data.xlsx"
+    sample_dataframe.write_excel(filepath)
+    first_read = BaseCycler.read_file(filepath)
+    second_read = BaseCycler.read_file(filepath)
+    assert first_read is not second_read
+    pl_testing.assert_frame_equal(first_read, second_read)
+    assert first_read.columns == sample_dataframe.columns
+
+    modified_dataframe = sample_dataframe.drop("T [s]")
+    modified_dataframe.write_excel(filepath)
+    os.utime(filepath, ns=(0, os.stat(filepath).st_mtime_ns + 1))
+    assert BaseCycler.read_file(filepath).columns == modified_dataframe.columns
+
+    # only the most recently read file is kept in the cache
+    other_filepath = "tests/sample_data/test_data_other.xlsx"
+    sample_dataframe.write_excel(other_filepath)
+    BaseCycler.read_file(other_filepath)
+    assert _read_excel.cache_info().currsize == 1
+    _read_excel.cache_clear()
+    assert _read_excel.cache_info().currsize == 0
+    os.remove(filepath)
+    os.remove(other_filepath)
+
+
 def test_missing_columns(sample_dataframe, sample_pyprobe_dataframe, column_dict):
     """Test with a dataframe missing columns."""
     df = copy.deepcopy(sample_dataframe)
@@ -34,7 +34,8 @@ def test_read_and_process_basytec(benchmark):
             "Voltage [V]": [3.53285],
             "Capacity [Ah]": [0.001248916998009],
             "Temperature [C]": [25.47953],
-        }
+        },
+        schema_overrides={"Event": pl.UInt32},
     )
     helper_read_and_process(
         benchmark,
@@ -74,7 +74,8 @@ def test_read_and_process_biologic(benchmark, biologic_cycler):
             "Voltage [V]": [3.4854481],
             "Capacity [Ah]": [-0.03237135133365209],
             "Temperature [C]": [23.029291],
-        }
+        },
+        schema_overrides={"Event": pl.UInt32},
     )
     pyprobe_dataframe = helper_read_and_process(
         benchmark,
@@ -106,7 +107,8 @@ def test_read_and_process_biologic_MB(benchmark, biologic_MB_cycler):
             "Voltage [V]": [3.062546],
             "Capacity [Ah]": [0.307727],
             "Temperature [C]": [22.989878],
-        }
+        },
+        schema_overrides={"Event": pl.UInt32},
     )
     pyprobe_dataframe = helper_read_and_process(
         benchmark,
@@ -25,7 +25,8 @@ def test_read_and_process_maccor(benchmark):
             "Voltage [V]": [3.716],
             "Capacity [Ah]": [0.048],
             "Temperature [C]": [22.2591],
-        }
+        },
+        schema_overrides={"Event": pl.UInt32},
     )
     helper_read_and_process(
         benchmark,
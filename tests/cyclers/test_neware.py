@@ -182,7 +182,8 @@ def test_read_and_process_neware(benchmark, neware_cycler):
             "Current [A]": [0.0],
             "Voltage [V]": [3.4513],
             "Capacity [Ah]": [0.022805],
-        }
+        },
+        schema_overrides={"Event": pl.UInt32},
     )
     expected_events = set(range(62))
     expected_columns = [
@@ -214,7 +215,8 @@ def test_read_and_process_neware_multi_file(benchmark):
             "Current [A]": [0.0],
             "Voltage [V]": [3.4513],
             "Capacity [Ah]": [0.004219859999949997],
-        }
+        },
+        schema_overrides={"Event": pl.UInt32},
     )
     expected_events = set(range(124))
     expected_columns = [
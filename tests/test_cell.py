@@ -76,7 +76,7 @@ def test_process_cycler_file(cell_instance, lazyframe_fixture):
     cell_instance.process_cycler_file("neware", folder_path, file_name, output_name)
     expected_dataframe = lazyframe_fixture.collect()
     expected_dataframe = expected_dataframe.with_columns(
-        pl.col("Date").dt.cast_time_unit("us")
+        pl.col("Date").dt.cast_time_unit("us"), pl.col("Event").cast(pl.UInt32)
     )
     saved_dataframe = pl.read_parquet(f"{folder_path}/{output_name}")
     saved_dataframe = saved_dataframe.select(pl.all().exclude("Temperature [C]"))
@@ -120,7 +120,8 @@ def test_process_generic_file(cell_instance):
             "Current [A]": [7.0, 8.0, 9.0],
             "Voltage [V]": [4.0, 5.0, 6.0],
             "Capacity [Ah]": [10.0, 11.0, 12.0],
-        }
+        },
+        schema_overrides={"Event": pl.UInt32},
     )
     saved_df = pl.read_parquet(f"{folder_path}/test_generic_file.parquet")
     assert_frame_equal(expected_df, saved_df, check_column_order=False)
@@ -128,6 +129,62 @@ def test_process_generic_file(cell_instance):
     os.remove(f"{folder_path}/test_generic_file.parquet")
 
 
+def test_output_is_up_to_date():
+    """Test the _output_is_up_to_date method."""
+    folder_path = "tests/sample_data/"
+    input_path = f"{folder_path}/test_up_to_date.csv"
+    output_path = f"{folder_path}/test_up_to_date.parquet"
+    pl.DataFrame({"x": [1, 2, 3]}).write_csv(input_path)
+    assert not Cell._output_is_up_to_date(input_path, output_path)
+
+    pl.DataFrame({"x": [1, 2, 3]}).write_parquet(output_path)
+    os.utime(input_path, (0, 0))
+    assert Cell._output_is_up_to_date(input_path, output_path)
+
+    os.utime(output_path, (0, 0))
+    os.utime(input_path)
+    assert not Cell._output_is_up_to_date(input_path, output_path)
+    os.remove(input_path)
+    os.remove(output_path)
+
+
+def test_process_file_up_to_date(cell_instance):
+    """Test that up to date parquet files are not rewritten."""
+    folder_path = "tests/sample_data/"
+    input_path = f"{folder_path}/test_up_to_date.csv"
+    output_path = f"{folder_path}/test_up_to_date.parquet"
+    pl.DataFrame({"x": [1, 2, 3]}).write_csv(input_path)
+    pl.DataFrame({"x": [1, 2, 3]}).write_parquet(output_path)
+    os.utime(input_path, (0, 0))
+    output_modified_time = os.stat(output_path).st_mtime_ns
+
+    # the input is not in cycler format, so would fail if it was converted
+    cell_instance.process_cycler_file(
+        "neware",
+        folder_path,
+        "test_up_to_date.csv",
+        "test_up_to_date.parquet",
+        overwrite_existing=False,
+    )
+    assert os.stat(output_path).st_mtime_ns == output_modified_time
+    cell_instance.process_generic_file(
+        folder_path,
+        "test_up_to_date.csv",
+        "test_up_to_date.parquet",
+        column_dict={"x": "Step"},
+        overwrite_existing=False,
+    )
+    assert os.stat(output_path).st_mtime_ns == output_modified_time
+    assert_frame_equal(pl.read_parquet(output_path), pl.DataFrame({"x": [1, 2, 3]}))
+
+    with pytest.raises(ValueError):
+        cell_instance.process_cycler_file(
+            "neware", folder_path, "test_up_to_date.csv", "test_up_to_date.parquet"
+        )
+    os.remove(input_path)
+    os.remove(output_path)
+
+
 def test_add_procedure(cell_instance, procedure_fixture, benchmark):
     """Test the add_procedure method."""
     input_path = "tests/sample_data/neware/"
@@ -0,0 +1,63 @@
+"""Tests for the dashboard module."""
+import numpy as np
+import polars as pl
+import pytest
+
+from pyprobe.dashboard import _parse_filter, downsample
+from pyprobe.result import Result
+
+
+def test_downsample():
+    """Test downsampling a result for plotting."""
+    x = np.arange(10000, dtype=np.float64)
+    y = np.sin(x / 100)
+    y[5000] = 10.0
+    result = Result(
+        base_dataframe=pl.DataFrame({"x": x, "y": y, "z": -y, "other": y}),
+        info={"Name": "Test_Cell", "color": "blue"},
+    )
+    downsampled = downsample(result, "x", "y", n_out=1000)
+    assert downsampled.column_list == ["x", "y"]
+    assert downsampled.info == result.info
+    assert len(downsampled.data) <= 1002
+    x_out, y_out = downsampled.get("x", "y")
+    assert np.all(np.diff(x_out) > 0)
+    assert x_out[0] == 0 and x_out[-1] == 9999
+    assert y_out.max() == 10.0
+    assert y_out.min() == y.min()
+
+    downsampled = downsample(result, "x", "y", secondary_y="z", n_out=1000)
+    assert downsampled.column_list == ["x", "y", "z"]
+    assert downsampled.get_only("z").min() == -10.0
+
+    # short data is returned unchanged
+    downsampled = downsample(result, "x", "y", n_out=20000)
+    np.testing.assert_array_equal(downsampled.get_only("y"), y)
+
+    # repeated columns are only returned once
+    downsampled = downsample(result, "x", "x", n_out=1000)
+    assert downsampled.column_list == ["x"]
+
+
+def test_parse_filter():
+    """Test parsing a filter string into filter methods and arguments."""
+    assert _parse_filter("cycle(1).step(2)") == (("cycle", (1,)), ("step", (2,)))
+    assert _parse_filter("step(-1)") == (("step", (-1,)),)
+    assert _parse_filter("cycle(range(0, 3)).discharge()") == (
+        ("cycle", (range(0, 3),)),
+        ("discharge", ()),
+    )
+    assert _parse_filter("step(1, 2, 3)") == (("step", (1, 2, 3)),)
+
+    for invalid in [
+        "cycle(1",
+        "cycle",
+        "cycle(1).data",
+        "__class__()",
+        "step(x)",
+        "step(1.5)",
+        "step(count=1)",
+        "cycle(1); import os",
+    ]:
+        with pytest.raises(ValueError):
+            _parse_filter(invalid)
@@ -119,6 +119,7 @@ def test_add_line(Plot_fixture, plot_result_fixture):
         mode="lines",
         line=dict(color=result.info["color"], dash="solid"),
         name=result.info["Name"],
+        legendgroup=result.info["Name"],
         showlegend=showlegend,
     )
     assert Plot_fixture._fig.data[0] == expected_trace
@@ -126,6 +127,24 @@ def test_add_line(Plot_fixture, plot_result_fixture):
     assert Plot_fixture.secondary_y is None
 
 
+def test_add_line_webgl(Plot_fixture):
+    """Test that lines with many points are drawn with WebGL."""
+    n_points = Plot_fixture.webgl_threshold + 1
+    result = Result(
+        base_dataframe=pl.DataFrame(
+            {"x": np.arange(n_points), "y": np.arange(n_points)}
+        ),
+        info={"color": "blue", "Name": "Line 1"},
+    )
+    Plot_fixture.add_line(result, "x", "y", secondary_y="y")
+    assert isinstance(Plot_fixture._fig.data[0], go.Scattergl)
+    assert isinstance(Plot_fixture._fig.data[1], go.Scattergl)
+
+    Plot_fixture.webgl_threshold = n_points
+    Plot_fixture.add_line(result, "x", "y")
+    assert isinstance(Plot_fixture._fig.data[2], go.Scatter)
+
+
 def test_add_line_with_secondary_y(Plot_fixture, plot_result_fixture):
     """Test the add_line method with secondary_y."""
     result = plot_result_fixture
@@ -147,6 +166,9 @@ def test_add_line_with_secondary_y(Plot_fixture, plot_result_fixture):
     )
 
     assert Plot_fixture.secondary_y == secondary_y
+    # the secondary y data only sets the secondary y limits
+    assert (Plot_fixture.y_min, Plot_fixture.y_max) == (5, 8)
+    assert (Plot_fixture.y2_min, Plot_fixture.y2_max) == (2, 5)
 
     expected_trace = go.Scatter(
         x=result.data[x],
@@ -154,6 +176,7 @@ def test_add_line_with_secondary_y(Plot_fixture, plot_result_fixture):
         mode="lines",
         line=dict(color=result.info["color"], dash="solid"),
         name=result.info["Name"],
+        legendgroup=result.info["Name"],
         showlegend=showlegend,
     )
     assert Plot_fixture._fig.data[0] == expected_trace
@@ -164,6 +187,7 @@ def test_add_line_with_secondary_y(Plot_fixture, plot_result_fixture):
         mode="lines",
         line=dict(color=result.info["color"], dash="dash"),
         name=result.info["Name"],
+        legendgroup=result.info["Name"],
         yaxis="y2",
         showlegend=False,
         xaxis="x",
@@ -235,10 +259,15 @@ def test_add_secondary_y_legend(Plot_fixture):
         mode="lines",
         line=dict(color="black", dash="dash"),
         name="secondary_y",
+        legendgroup="_secondary_y",
         showlegend=True,
     )
     assert Plot_fixture._fig.data[0] == expected_trace
 
+    # the legend is only added once
+    Plot_fixture._add_secondary_y_legend("secondary_y")
+    assert len(Plot_fixture._fig.data) == 1
+
 
 def test_fig(Plot_fixture, plot_result_fixture):
     """Test the fig method."""
@@ -303,6 +332,10 @@ def test_fig(Plot_fixture, plot_result_fixture):
     assert result.layout.yaxis2 == expected_y2_layout
     assert result.layout.legend == expected_legend_layout
 
+    # accessing the figure again does not duplicate the secondary y legend
+    assert len(result.data) == 3
+    assert len(Plot_fixture.fig.data) == 3
+
 
 def test_show(Plot_fixture, mocker):
     """Test the show method."""
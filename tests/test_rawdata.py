@@ -63,8 +63,14 @@ def test_pybamm_experiment(RawData_fixture):
 
 def test_capacity(BreakinCycles_fixture):
     """Test the capacity property."""
-    capacity = BreakinCycles_fixture.cycle(0).charge(0).capacity
+    charge = BreakinCycles_fixture.cycle(0).charge(0)
+    capacity = charge.capacity
     assert np.isclose(capacity, 41.08565 / 1000)
+    assert charge.capacity == capacity
+
+    # the capacity is recalculated when the data is replaced
+    charge.base_dataframe = charge.data.head(1)
+    assert charge.capacity == 0
 
 
 def test_set_SOC(BreakinCycles_fixture):
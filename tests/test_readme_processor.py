@@ -1,4 +1,6 @@
 """Tests for the readme_processor module."""
+import os
+import shutil
 
 import pytest
 
@@ -136,6 +138,23 @@ def test_process_readme_file_implicit(titles_fixture, benchmark):
     assert readme.experiment_dict["Discharge Pulses"]["Cycles"] == []
 
 
+def test_process_readme_cached():
+    """Test that a readme file is parsed again only once it has been modified."""
+    readme_path = "tests/sample_data/README_cached.yaml"
+    shutil.copy("tests/sample_data/neware/README.yaml", readme_path)
+    readme = process_readme(readme_path)
+    # modifying the parsed readme does not modify the cached copy
+    readme.readme_dict["Break-in Cycles"]["Steps"] = {}
+    experiment_dict = process_readme(readme_path).experiment_dict
+    assert experiment_dict["Break-in Cycles"]["Steps"] == [4, 5, 6, 7]
+
+    shutil.copy("tests/sample_data/neware/README_implicit.yaml", readme_path)
+    os.utime(readme_path, ns=(0, os.stat(readme_path).st_mtime_ns + 1))
+    experiment_dict = process_readme(readme_path).experiment_dict
+    assert experiment_dict["Discharge Pulses"]["Steps"] == [8, 9, 10, 11]
+    os.remove(readme_path)
+
+
 def process_readme_file_total_steps(titles_fixture, benchmark):
     """Test processing a readme file in yaml format."""
 
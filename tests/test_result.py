@@ -67,6 +67,26 @@ def test_get_only(Result_fixture):
     np_testing.assert_array_equal(current_mA, current * 1000)
 
 
+def test_get_cached(Result_fixture):
+    """Test that repeated requests for the same columns reuse the collected data."""
+    current = Result_fixture.array("Current [A]")
+    assert ("frame", ("Current [A]",)) in Result_fixture._cache
+    np_testing.assert_array_equal(Result_fixture.array("Current [A]"), current)
+    time, _ = Result_fixture.get("Time [s]", "Voltage [V]")
+    time -= time[0]
+    assert time[0] == 0
+
+    Result_fixture.base_dataframe = Result_fixture.base_dataframe.with_columns(
+        pl.col("Current [A]") * 2
+    )
+    np_testing.assert_array_equal(Result_fixture.array("Current [A]"), current * 2)
+
+    # columns of a DataFrame are converted directly, without caching
+    Result_fixture.base_dataframe = Result_fixture.base_dataframe.collect()
+    np_testing.assert_array_equal(Result_fixture.array("Current [A]"), current * 2)
+    assert not any(key[0] == "frame" for key in Result_fixture._cache)
+
+
 def test_array(Result_fixture):
     """Test the array method."""
     array = Result_fixture.array()
@@ -110,6 +130,18 @@ def test_quantities(Result_fixture):
     )
 
 
+def test_column_list(Result_fixture):
+    """Test the column_list property."""
+    columns = Result_fixture.column_list
+    assert columns == Result_fixture.base_dataframe.collect_schema().names()
+    assert "Current [mA]" not in Result_fixture.column_list
+    Result_fixture.base_dataframe = Result_fixture.base_dataframe.with_columns(
+        (pl.col("Current [A]") * 1000).alias("Current [mA]")
+    )
+    assert "Current [mA]" in Result_fixture.column_list
+    assert "Current [mA]" not in columns
+
+
 def test_check_units(Result_fixture):
     """Test the _check_units method."""
     assert "Current [mA]" not in Result_fixture.data.columns
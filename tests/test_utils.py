@@ -7,3 +7,8 @@ def test_flatten():
     lst = [[1, 2, 3], [4, 5], 6]
     flat_list = utils.flatten_list(lst)
     assert flat_list == [1, 2, 3, 4, 5, 6]
+
+    assert utils.flatten_list([1, 2, 3]) == [1, 2, 3]
+    assert utils.flatten_list([[1, 2], [3]]) == [1, 2, 3]
+    assert utils.flatten_list([[1, [2, [3]]], [4]]) == [1, 2, 3, 4]
+    assert utils.flatten_list(1) == [1]